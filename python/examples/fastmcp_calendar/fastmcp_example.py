@@ -5,19 +5,27 @@ This example demonstrates:
 1. Protecting MCP tools with Descope session validation and scope validation
 2. Getting connection tokens from Descope when required by tools
 3. Using connection tokens to call external APIs (Google Calendar)
+
+Install the SDK in development mode (``pip install -e .`` from the ``python``
+directory) before running it; when run as a script, the in-repo sources are only
+put on ``sys.path`` as a fallback if ``descope_mcp`` is not importable.
 """
 
+import importlib.util
 import json
 import os
 import sys
+from contextlib import asynccontextmanager
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
-example_dir = Path(__file__).parent
-root_dir = example_dir.parent.parent
-sdk_src = root_dir / "src"
-if sdk_src.exists():
-    sys.path.insert(0, str(sdk_src))
+# Only bootstrap when run as a script; importers are expected to have the SDK installed
+if __name__ == "__main__" and importlib.util.find_spec("descope_mcp") is None:
+    sdk_src = Path(__file__).parent.parent.parent / "src"
+    if sdk_src.exists():
+        sys.path.insert(0, str(sdk_src))
 
 from fastmcp import FastMCP
 from fastmcp.server.auth.providers.descope import DescopeProvider
@@ -25,9 +33,11 @@ from fastmcp.server.auth.providers.descope import DescopeProvider
 from descope_mcp import (
     DescopeMCP,
     InsufficientScopeError,
-    get_connection_token,
-    validate_token,
+    aclose_http_clients,
+    get_connection_token_async,
+    validate_token_and_get_user_id,
     validate_token_require_scopes_and_get_user_id,
+    validate_token_require_scopes_and_get_user_id_async,
 )
 
 try:
@@ -35,6 +45,176 @@ try:
 except ImportError:
     httpx = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize a compact tool response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Configuration read once at import time
+_WELL_KNOWN_URL = os.getenv(
+    "DESCOPE_MCP_WELL_KNOWN_URL",
+    "https://api.descope.com/your-project-id/.well-known/openid-configuration",
+)
+_MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "https://your-mcp-server.com")
+_GOOGLE_CALENDAR_APP_ID = os.getenv("GOOGLE_CALENDAR_APP_ID", "google-calendar")
+
+# Required MCP token scopes, built once instead of per tool call
+_SCOPES_READ = frozenset({"read"})
+_SCOPES_CALENDAR_READ = frozenset({"calendar.read"})
+
+_CALENDAR_EVENTS_URL = "https://www.googleapis.com/calendar/v3/calendars/primary/events"
+_CALENDAR_BASE_HEADERS = {"Accept": "application/json"}
+# Query values pre-serialized as strings, the form httpx would send them in
+_CALENDAR_BASE_PARAMS = {"singleEvents": "true", "orderBy": "startTime"}
+
+# Only this much of an API error body is read and reported back to the caller
+_ERROR_DETAILS_MAX_BYTES = 200
+
+# Shared HTTP client for outbound API calls, opened and closed by the server lifespan
+# so every tool call reuses pooled keep-alive connections instead of a new handshake.
+_http_client: Optional["httpx.AsyncClient"] = None
+
+
+def _new_http_client() -> "httpx.AsyncClient":
+    """Build the pooled HTTP client, using HTTP/2 when the h2 package is installed."""
+    return httpx.AsyncClient(
+        http2=importlib.util.find_spec("h2") is not None,
+        timeout=10.0,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+def _get_http_client() -> "httpx.AsyncClient":
+    """Get the shared HTTP client, creating it if tools run outside the lifespan."""
+    global _http_client
+    if _http_client is None:
+        _http_client = _new_http_client()
+    return _http_client
+
+
+@asynccontextmanager
+async def _http_client_lifespan(server):
+    """Open the shared HTTP clients on server startup and close them on shutdown."""
+    global _http_client
+    client = _get_http_client()
+    try:
+        yield
+    finally:
+        _http_client = None
+        await client.aclose()
+        # Also release the SDK's pooled client used for Descope API calls
+        await aclose_http_clients()
+
+
+class _AsyncByteReader:
+    """Adapt a streamed httpx response to the async file interface ijson reads from."""
+
+    def __init__(self, response: "httpx.Response"):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes with read(0) to detect bytes vs. str; don't consume a chunk
+        if size == 0:
+            return b""
+        return await anext(self._chunks, b"")
+
+
+# Fallback for missing nested fields, read-only since every caller shares it
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _format_event(item: Dict) -> Dict:
+    """Reduce a Google Calendar event to the fields returned by the tool."""
+    start = item.get("start") or _EMPTY
+    end = item.get("end") or _EMPTY
+    description = item.get("description")
+    return {
+        "id": item.get("id"),
+        "summary": item.get("summary", "No title"),
+        "start": start.get("dateTime") or start.get("date"),
+        "end": end.get("dateTime") or end.get("date"),
+        "location": item.get("location"),
+        "description": description[:100] if description else None,
+    }
+
+
+async def _read_error_head(response: "httpx.Response") -> "httpx.Response":
+    """Read just the start of a streamed error body into a detached response."""
+    head = b""
+    async for chunk in response.aiter_bytes():
+        head += chunk
+        if len(head) >= _ERROR_DETAILS_MAX_BYTES:
+            break
+    return httpx.Response(
+        response.status_code,
+        content=head[:_ERROR_DETAILS_MAX_BYTES],
+        request=response.request,
+    )
+
+
+async def _fetch_calendar_events(
+    headers: Dict[str, str], params: Dict, max_results: int
+) -> List[Dict]:
+    """Fetch up to max_results calendar events, formatted for the tool response.
+
+    With ijson installed, the response is parsed incrementally, each event is
+    formatted as soon as it is parsed, and reading stops once enough events have
+    been seen; otherwise the whole body is parsed at once.
+    """
+    if ijson is None:
+        response = await _get_http_client().get(
+            _CALENDAR_EVENTS_URL, headers=headers, params=params
+        )
+        response.raise_for_status()
+        body = orjson.loads(response.content) if orjson is not None else response.json()
+        items = body.get("items") or ()
+        return [_format_event(item) for item in islice(items, max_results)]
+
+    events: List[Dict] = []
+    async with _get_http_client().stream(
+        "GET", _CALENDAR_EVENTS_URL, headers=headers, params=params
+    ) as response:
+        if response.is_error:
+            # Skip the rest of a possibly large error page; the handler only
+            # reports the first few hundred bytes
+            (await _read_error_head(response)).raise_for_status()
+        async for item in ijson.items(
+            _AsyncByteReader(response), "items.item", use_float=True
+        ):
+            events.append(_format_event(item))
+            if len(events) >= max_results:
+                break
+    return events
+
+
+# Providers keyed by (config_url, base_url), so rebuilding the server reuses the
+# provider that already loaded the OIDC discovery document and JWKS.
+_descope_providers: Dict[Tuple[str, str], DescopeProvider] = {}
+
+
+def _get_descope_provider(config_url: str, base_url: str) -> DescopeProvider:
+    """Get the DescopeProvider for a config URL and base URL, creating it once."""
+    key = (config_url, base_url)
+    provider = _descope_providers.get(key)
+    if provider is None:
+        provider = _descope_providers[key] = DescopeProvider(
+            config_url=config_url, base_url=base_url
+        )
+    return provider
+
 
 def create_mcp_server():
     """Create a FastMCP server with Descope authentication and Google Calendar integration.
@@ -48,27 +228,22 @@ def create_mcp_server():
     Note: Only one FastMCP server can run per process.
     Each server listens on stdin/stdout for MCP protocol communication.
     """
+    # The calendar tools call Google's API, so fail at startup rather than per call
+    if httpx is None:
+        raise ImportError(
+            "httpx required for API calls. Install with: pip install httpx"
+        )
 
     # Initialize Descope SDK
-    DescopeMCP(
-        well_known_url=os.getenv(
-            "DESCOPE_MCP_WELL_KNOWN_URL",
-            "https://api.descope.com/your-project-id/.well-known/openid-configuration",
-        ),
-        mcp_server_url=os.getenv("MCP_SERVER_URL", "https://your-mcp-server.com"),
-    )
-
-    GOOGLE_CALENDAR_APP_ID = os.getenv("GOOGLE_CALENDAR_APP_ID", "google-calendar")
+    DescopeMCP(well_known_url=_WELL_KNOWN_URL, mcp_server_url=_MCP_SERVER_URL)
 
     # FastMCP auth: configure Descope as the auth layer for your MCP server
-    auth_provider = DescopeProvider(
-        config_url=os.getenv(
-            "DESCOPE_MCP_WELL_KNOWN_URL",
-            "https://api.descope.com/your-project-id/.well-known/openid-configuration",
-        ),
-        base_url=os.getenv("MCP_SERVER_URL", "https://your-mcp-server.com"),
+    auth_provider = _get_descope_provider(_WELL_KNOWN_URL, _MCP_SERVER_URL)
+    mcp = FastMCP(
+        name="descope-calendar-server",
+        auth=auth_provider,
+        lifespan=_http_client_lifespan,
     )
-    mcp = FastMCP(name="descope-calendar-server", auth=auth_provider)
 
     # Public tool - no authentication required
     @mcp.tool()
@@ -84,11 +259,10 @@ def create_mcp_server():
         Requires a valid MCP access token.
         """
         try:
-            token_result = validate_token(mcp_access_token)
-            user_id = token_result.get("sub") or token_result.get("userId")
+            user_id = validate_token_and_get_user_id(mcp_access_token)
             return f"Authenticated user information for user: {user_id}"
         except Exception as e:
-            return json.dumps({"error": f"Authentication failed: {str(e)}"})
+            return _dumps({"error": f"Authentication failed: {str(e)}"})
 
     # Scope-protected tool - requires 'read' scope
     @mcp.tool()
@@ -97,13 +271,13 @@ def create_mcp_server():
         try:
             # Validate token, require scopes, and get user ID in one call
             user_id = validate_token_require_scopes_and_get_user_id(
-                mcp_access_token, required_scopes=["read"]
+                mcp_access_token, required_scopes=_SCOPES_READ
             )
             return f"Data read successfully for user {user_id}"
         except InsufficientScopeError as e:
             return e.to_json()
         except Exception as e:
-            return json.dumps({"error": f"Authorization failed: {str(e)}"})
+            return _dumps({"error": f"Authorization failed: {str(e)}"})
 
     # Google Calendar tool - requires 'calendar.read' scope and uses connection token
     @mcp.tool()
@@ -117,85 +291,55 @@ def create_mcp_server():
         """
         try:
             # Validate token, require scopes, and get user ID in one call
-            user_id = validate_token_require_scopes_and_get_user_id(
-                mcp_access_token, required_scopes=["calendar.read"]
+            user_id = await validate_token_require_scopes_and_get_user_id_async(
+                mcp_access_token, required_scopes=_SCOPES_CALENDAR_READ
             )
 
             # Get connection token using MCP access token (enables policy enforcement)
-            google_token = get_connection_token(
+            google_token = await get_connection_token_async(
                 user_id=user_id,
-                app_id=GOOGLE_CALENDAR_APP_ID,
+                app_id=_GOOGLE_CALENDAR_APP_ID,
                 scopes=["https://www.googleapis.com/auth/calendar"],
                 access_token=mcp_access_token,  # Uses access token by default
             )
 
             # Call Google Calendar API with connection token
-            if not httpx:
-                raise ImportError(
-                    "httpx required for API calls. Install with: pip install httpx"
-                )
-
-            async with httpx.AsyncClient() as client:
-                headers = {
-                    "Authorization": f"Bearer {google_token}",
-                    "Accept": "application/json",
-                }
+            headers = {
+                **_CALENDAR_BASE_HEADERS,
+                "Authorization": f"Bearer {google_token}",
+            }
+            params = {
+                **_CALENDAR_BASE_PARAMS,
+                "maxResults": max_results,
+                **({"timeMin": time_min} if time_min else _EMPTY),
+            }
+
+            formatted_events = await _fetch_calendar_events(
+                headers, params, max_results
+            )
 
-                params = {
-                    "maxResults": max_results,
-                    "singleEvents": True,
-                    "orderBy": "startTime",
+            return _dumps(
+                {
+                    "status": "success",
+                    "user_id": user_id,
+                    "events_count": len(formatted_events),
+                    "events": formatted_events,
                 }
-                if time_min:
-                    params["timeMin"] = time_min
-
-                response = await client.get(
-                    "https://www.googleapis.com/calendar/v3/calendars/primary/events",
-                    headers=headers,
-                    params=params,
-                    timeout=10.0,
-                )
-                response.raise_for_status()
-
-                events = response.json()
-                formatted_events = []
-                for item in events.get("items", [])[:max_results]:
-                    formatted_events.append(
-                        {
-                            "id": item.get("id"),
-                            "summary": item.get("summary", "No title"),
-                            "start": item.get("start", {}).get("dateTime")
-                            or item.get("start", {}).get("date"),
-                            "end": item.get("end", {}).get("dateTime")
-                            or item.get("end", {}).get("date"),
-                            "location": item.get("location"),
-                            "description": item.get("description", "")[:100]
-                            if item.get("description")
-                            else None,
-                        }
-                    )
-
-                return json.dumps(
-                    {
-                        "status": "success",
-                        "user_id": user_id,
-                        "events_count": len(formatted_events),
-                        "events": formatted_events,
-                    },
-                    indent=2,
-                )
+            )
 
         except InsufficientScopeError as e:
             return e.to_json()
         except httpx.HTTPStatusError as e:
-            return json.dumps(
+            return _dumps(
                 {
                     "error": f"Google Calendar API error: {e.response.status_code}",
-                    "details": e.response.text[:200],
+                    "details": e.response.content[:_ERROR_DETAILS_MAX_BYTES].decode(
+                        "utf-8", errors="replace"
+                    ),
                 }
             )
         except Exception as e:
-            return json.dumps({"error": str(e), "type": type(e).__name__})
+            return _dumps({"error": str(e), "type": type(e).__name__})
 
     @mcp.tool()
     async def list_calendars(mcp_access_token: str) -> str:
@@ -205,12 +349,10 @@ def create_mcp_server():
         """
         try:
             # Validate token, require scopes, and get user ID in one call
-            user_id = validate_token_require_scopes_and_get_user_id(
-                mcp_access_token, required_scopes=["calendar.read"]
-            )
-            return json.dumps(
-                {"message": "Calendar list retrieved", "user_id": user_id}
+            user_id = await validate_token_require_scopes_and_get_user_id_async(
+                mcp_access_token, required_scopes=_SCOPES_CALENDAR_READ
             )
+            return _dumps({"message": "Calendar list retrieved", "user_id": user_id})
         except InsufficientScopeError as e:
             return e.to_json()
 
@@ -224,7 +366,14 @@ def main():
     Each server listens on stdin/stdout for MCP protocol communication.
     """
     mcp = create_mcp_server()
-    mcp.run()
+    # Prefer the libuv-based event loop when uvloop is installed; imported here so
+    # importing this module doesn't pay for it
+    try:
+        import uvloop
+    except ImportError:
+        mcp.run()
+    else:
+        uvloop.run(mcp.run_async())
 
 
 if __name__ == "__main__":
@@ -5,49 +5,83 @@ This example demonstrates:
 1. An MCP server that requires tenant-level access (not user-specific)
 2. Fetching tenant tokens using management key (no user session required)
 3. Using tenant tokens to access tenant resources
+
+Install the SDK in development mode (``pip install -e .`` from the ``python``
+directory) before running it; when run as a script, the in-repo sources are only
+put on ``sys.path`` as a fallback if ``descope_mcp`` is not importable.
 """
 
+import importlib.util
 import json
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
-example_dir = Path(__file__).parent
-root_dir = example_dir.parent.parent
-sdk_src = root_dir / "src"
-if sdk_src.exists():
-    sys.path.insert(0, str(sdk_src))
+# Only bootstrap when run as a script; importers are expected to have the SDK installed
+if __name__ == "__main__" and importlib.util.find_spec("descope_mcp") is None:
+    sdk_src = Path(__file__).parent.parent.parent / "src"
+    if sdk_src.exists():
+        sys.path.insert(0, str(sdk_src))
 
 from mcp.server import FastMCP
 
 from descope_mcp import DescopeMCP, fetch_tenant_token, fetch_tenant_token_by_scopes
 from descope_mcp.types import DescopeConfig
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj) -> str:
+    """Serialize a compact tool response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _loads(data):
+    """Parse a JSON response, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Configuration read once at import time and shared by every tool call
+_CONFIG = DescopeConfig(
+    well_known_url=os.getenv(
+        "DESCOPE_MCP_WELL_KNOWN_URL",
+        "https://api.descope.com/your-project-id/.well-known/openid-configuration",
+    ),
+    management_key=os.getenv("DESCOPE_MANAGEMENT_KEY", ""),
+)
+_MCP_SERVER_URL = os.getenv("MCP_SERVER_URL", "https://your-mcp-server.com")
+
+# Outbound app ID configured in Descope for tenant access
+_TENANT_APP_ID = os.getenv("TENANT_APP_ID", "slack-workspace")
+_TENANT_ID = os.getenv("TENANT_ID", "tenant-123")
+
 
 def example_tenant_token_mcp_server():
     """Example: MCP server using tenant tokens."""
 
     # Initialize SDK - management key is required for tenant token operations
+    if not _CONFIG.management_key:
+        raise ValueError("DESCOPE_MANAGEMENT_KEY is required for tenant tokens")
     DescopeMCP(
-        well_known_url=os.getenv(
-            "DESCOPE_MCP_WELL_KNOWN_URL",
-            "https://api.descope.com/your-project-id/.well-known/openid-configuration",
-        ),
-        management_key=os.getenv("DESCOPE_MANAGEMENT_KEY", ""),
-        mcp_server_url=os.getenv("MCP_SERVER_URL", "https://your-mcp-server.com"),
+        well_known_url=_CONFIG.well_known_url,
+        management_key=_CONFIG.management_key,
+        mcp_server_url=_MCP_SERVER_URL,
     )
 
-    # Outbound app ID configured in Descope for tenant access
-    TENANT_APP_ID = os.getenv("TENANT_APP_ID", "slack-workspace")
-    TENANT_ID = os.getenv("TENANT_ID", "tenant-123")
-
     mcp = FastMCP("tenant-token-mcp-server")
 
     @mcp.tool()
     async def get_tenant_token(
-        app_id: str = TENANT_APP_ID,
-        tenant_id: str = TENANT_ID,
+        app_id: str = _TENANT_APP_ID,
+        tenant_id: str = _TENANT_ID,
         scopes: Optional[list] = None,
     ) -> str:
         """Get tenant token using management key.
@@ -55,60 +89,47 @@ def example_tenant_token_mcp_server():
         No user session required - uses management key for tenant-level access.
         """
         try:
-            config = DescopeConfig(
-                well_known_url=os.getenv("DESCOPE_MCP_WELL_KNOWN_URL", ""),
-                management_key=os.getenv("DESCOPE_MANAGEMENT_KEY", ""),
-            )
-
             if scopes:
                 token_response = await fetch_tenant_token_by_scopes(
-                    config=config, app_id=app_id, tenant_id=tenant_id, scopes=scopes
+                    config=_CONFIG, app_id=app_id, tenant_id=tenant_id, scopes=scopes
                 )
             else:
                 token_response = await fetch_tenant_token(
-                    config=config, app_id=app_id, tenant_id=tenant_id
+                    config=_CONFIG, app_id=app_id, tenant_id=tenant_id
                 )
 
             # Parse token from JSON response
-            token_data = json.loads(token_response)
-            token = token_data.get("token", "")
+            token = _loads(token_response).get("token", "")
 
-            return json.dumps(
+            return _dumps(
                 {
                     "status": "success",
                     "tenant_id": tenant_id,
                     "app_id": app_id,
                     "token": token,
-                },
-                indent=2,
+                }
             )
         except Exception as e:
-            return json.dumps({"error": str(e), "type": type(e).__name__})
+            return _dumps({"error": str(e), "type": type(e).__name__})
 
     @mcp.tool()
     async def get_slack_workspace_info() -> str:
         """Get Slack workspace information using tenant token."""
         try:
-            config = DescopeConfig(
-                well_known_url=os.getenv("DESCOPE_MCP_WELL_KNOWN_URL", ""),
-                management_key=os.getenv("DESCOPE_MANAGEMENT_KEY", ""),
-            )
-
             token_response = await fetch_tenant_token(
-                config=config, app_id=TENANT_APP_ID, tenant_id=TENANT_ID
+                config=_CONFIG, app_id=_TENANT_APP_ID, tenant_id=_TENANT_ID
             )
 
-            token_data = json.loads(token_response)
-            token = token_data.get("token", "")
+            token = _loads(token_response).get("token", "")
 
             if not token:
-                return json.dumps({"error": "Failed to get tenant token"})
+                return _dumps({"error": "Failed to get tenant token"})
 
-            return json.dumps(
-                {"status": "success", "tenant_id": TENANT_ID, "token": token}
+            return _dumps(
+                {"status": "success", "tenant_id": _TENANT_ID, "token": token}
             )
         except Exception as e:
-            return json.dumps({"error": str(e), "type": type(e).__name__})
+            return _dumps({"error": str(e), "type": type(e).__name__})
 
     return mcp
 
@@ -1,38 +1,101 @@
 """MCP SDK for Descope authentication."""
 
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 __version__ = "0.1.0"
 
-from .client import DescopeMCPClient
-from .connections import get_connection_token
-from .descope_mcp import (
-    DescopeMCP,
-    add_descope_tools,
-    create_auth_check,
-    create_descope_fastmcp_server,
-    fetch_tenant_token,
-    fetch_tenant_token_by_scopes,
-    fetch_user_token,
-    fetch_user_token_by_scopes,
-    get_descope_client,
-    init_descope_mcp,
-)
-from .server import DescopeMCPServer
-from .session import (
-    InsufficientScopeError,
-    TokenValidationResult,
-    require_scopes,
-    validate_token,
-    validate_token_and_get_user_id,
-    validate_token_require_scopes_and_get_user_id,
-)
-from .types import (
-    DescopeConfig,
-    ErrorResponse,
-    TenantTokenRequest,
-    TokenRequest,
-    TokenResponse,
-    UserTokenRequest,
-)
+if TYPE_CHECKING:  # pragma: no cover
+    from .client import DescopeMCPClient
+    from .connections import (
+        aclose_http_clients,
+        get_connection_token,
+        get_connection_token_async,
+        get_connection_tokens_bulk,
+    )
+    from .descope_mcp import (
+        DescopeMCP,
+        add_descope_tools,
+        create_auth_check,
+        create_descope_fastmcp_server,
+        fetch_tenant_token,
+        fetch_tenant_token_by_scopes,
+        fetch_user_token,
+        fetch_user_token_by_scopes,
+        get_descope_client,
+        init_descope_mcp,
+    )
+    from .server import DescopeMCPServer
+    from .session import (
+        InsufficientScopeError,
+        TokenValidationResult,
+        require_scopes,
+        validate_token,
+        validate_token_and_get_user_id,
+        validate_token_and_get_user_id_async,
+        validate_token_async,
+        validate_token_require_scopes_and_get_user_id,
+        validate_token_require_scopes_and_get_user_id_async,
+    )
+    from .types import (
+        DescopeConfig,
+        ErrorResponse,
+        TenantTokenRequest,
+        TokenRequest,
+        TokenResponse,
+        UserTokenRequest,
+    )
+
+# Public names and the submodule defining each. They are imported on first
+# access (PEP 562), so e.g. using only DescopeConfig doesn't load the MCP server
+# and client stacks.
+_LAZY_IMPORTS = {
+    "DescopeMCPClient": "client",
+    "get_connection_token": "connections",
+    "get_connection_token_async": "connections",
+    "get_connection_tokens_bulk": "connections",
+    "aclose_http_clients": "connections",
+    "DescopeMCP": "descope_mcp",
+    "add_descope_tools": "descope_mcp",
+    "create_auth_check": "descope_mcp",
+    "create_descope_fastmcp_server": "descope_mcp",
+    "fetch_tenant_token": "descope_mcp",
+    "fetch_tenant_token_by_scopes": "descope_mcp",
+    "fetch_user_token": "descope_mcp",
+    "fetch_user_token_by_scopes": "descope_mcp",
+    "get_descope_client": "descope_mcp",
+    "init_descope_mcp": "descope_mcp",
+    "DescopeMCPServer": "server",
+    "InsufficientScopeError": "session",
+    "TokenValidationResult": "session",
+    "require_scopes": "session",
+    "validate_token": "session",
+    "validate_token_and_get_user_id": "session",
+    "validate_token_and_get_user_id_async": "session",
+    "validate_token_async": "session",
+    "validate_token_require_scopes_and_get_user_id": "session",
+    "validate_token_require_scopes_and_get_user_id_async": "session",
+    "DescopeConfig": "types",
+    "ErrorResponse": "types",
+    "TenantTokenRequest": "types",
+    "TokenRequest": "types",
+    "TokenResponse": "types",
+    "UserTokenRequest": "types",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "DescopeMCPClient",
@@ -49,10 +112,16 @@ __all__ = [
     "validate_token",
     "validate_token_and_get_user_id",
     "validate_token_require_scopes_and_get_user_id",
+    "validate_token_async",
+    "validate_token_and_get_user_id_async",
+    "validate_token_require_scopes_and_get_user_id_async",
     "TokenValidationResult",
     "require_scopes",
     "InsufficientScopeError",
     "get_connection_token",
+    "get_connection_token_async",
+    "get_connection_tokens_bulk",
+    "aclose_http_clients",
     "create_auth_check",
     "DescopeConfig",
     "ErrorResponse",
@@ -0,0 +1,62 @@
+"""In-memory caching helpers for Descope MCP SDK.
+
+This module provides the small bounded caches the SDK uses to avoid repeating
+expensive work (token signature verification, Descope API round-trips) for
+values that are known to stay valid for a while.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class ExpiringCache(Generic[V]):
+    """Thread-safe LRU cache whose entries each expire at their own deadline.
+
+    Expired entries are dropped lazily when they are looked up, and the least
+    recently used entry is evicted once the cache grows past ``maxsize``.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept before LRU eviction
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: V, expires_at: float) -> None:
+        """Cache value until the given Unix timestamp."""
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
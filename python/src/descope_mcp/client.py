@@ -1,15 +1,16 @@
 """Client interface for Descope MCP server."""
 
 import asyncio
+import contextlib
+import itertools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from mcp.client.session import ClientSession
-from mcp.client.stdio import stdio_client
-from mcp.types import CallToolRequest
+from mcp.client.stdio import StdioServerParameters, stdio_client
 
-from .types import DescopeConfig, ErrorResponse, TokenResponse
+from .types import DescopeConfig, ErrorResponse, TokenResponse, UserTokenRequest
 
 logger = logging.getLogger(__name__)
 
@@ -17,38 +18,172 @@ logger = logging.getLogger(__name__)
 class DescopeMCPClient:
     """Client for interacting with Descope MCP server."""
 
-    def __init__(self, server_command: List[str]):
+    def __init__(self, server_command: List[str], pool_size: int = 1):
         """Initialize the Descope MCP client.
 
         Args:
             server_command: Command to start the MCP server
+            pool_size: Number of server sessions to keep open; tool calls are
+                spread across them round-robin
         """
+        if pool_size < 1:
+            raise ValueError("pool_size must be at least 1")
         self.server_command = server_command
+        self.pool_size = pool_size
+        # Event loop the connection state below belongs to
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._reset_connection_state()
+
+    def _reset_connection_state(self) -> None:
+        """Forget all connection state, leaving the client disconnected."""
         self.session: Optional[ClientSession] = None
+        self._sessions: List[ClientSession] = []
+        self._next_session: Optional[Iterator[ClientSession]] = None
+        # Task that owns the server transports, and the event that tells it to close
+        self._owner_task: Optional["asyncio.Task[None]"] = None
+        self._closing: Optional[asyncio.Event] = None
+        # Serializes connect/disconnect, so concurrent callers share one connection
+        self._lifecycle_lock = asyncio.Lock()
+        self._context_users = 0
+
+    def _bind_to_running_loop(self) -> None:
+        """Bind the client to the running loop, dropping state of a closed one.
+
+        A shared client can be reused by a later asyncio.run(); its previous
+        sessions were torn down when their loop cancelled the owner task.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None and not self._loop.is_closed():
+            if self.session is not None or self._context_users:
+                raise RuntimeError(
+                    "DescopeMCPClient is connected on another event loop"
+                )
+        self._reset_connection_state()
+        self._loop = loop
 
     async def __aenter__(self):
         """Async context manager entry."""
-        await self.connect()
+        self._bind_to_running_loop()
+        self._context_users += 1
+        try:
+            await self.connect()
+        except BaseException:
+            self._context_users -= 1
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.disconnect()
+        """Async context manager exit.
+
+        A client shared between ``async with`` blocks, in one task or several,
+        stays connected until the last of them exits.
+        """
+        self._context_users -= 1
+        async with self._lifecycle_lock:
+            # Re-checked under the lock: another block may have entered meanwhile
+            if self._context_users == 0:
+                await self._disconnect()
 
     async def connect(self):
-        """Connect to the MCP server."""
-        if self.session is not None:
-            return
+        """Connect to the MCP server.
+
+        Sessions stay open until disconnect(), so repeated tool calls reuse them
+        instead of starting and initializing the server each time.
+        """
+        self._bind_to_running_loop()
+        async with self._lifecycle_lock:
+            if self.session is not None:
+                return
 
-        read_stream, write_stream = await stdio_client(self.server_command)
-        self.session = ClientSession(read_stream, write_stream)
-        await self.session.initialize()
+            sessions_ready: "asyncio.Future[List[ClientSession]]" = (
+                asyncio.get_running_loop().create_future()
+            )
+            closing = asyncio.Event()
+            owner_task = asyncio.create_task(
+                self._run_sessions(sessions_ready, closing)
+            )
+            try:
+                sessions = await asyncio.shield(sessions_ready)
+            except BaseException:
+                # Stop the owner task if we were cancelled while it was connecting
+                closing.set()
+                await asyncio.gather(owner_task, return_exceptions=True)
+                if sessions_ready.done() and not sessions_ready.cancelled():
+                    sessions_ready.exception()  # Mark a late failure as retrieved
+                raise
+
+            self._owner_task = owner_task
+            self._closing = closing
+            self._sessions = sessions
+            self._next_session = itertools.cycle(self._sessions)
+            self.session = self._sessions[0]
+
+    async def _run_sessions(
+        self,
+        sessions_ready: "asyncio.Future[List[ClientSession]]",
+        closing: asyncio.Event,
+    ) -> None:
+        """Open the server sessions and keep them open until closing is set.
+
+        The stdio transports must be exited from the task that entered them, so a
+        single task owns them for the client's whole connection, whichever task
+        connects or disconnects.
+        """
+        server = StdioServerParameters(
+            command=self.server_command[0], args=self.server_command[1:]
+        )
+        try:
+            async with contextlib.AsyncExitStack() as exit_stack:
+                # Opened one by one rather than gathered, for the same reason
+                sessions = [
+                    await self._open_session(exit_stack, server)
+                    for _ in range(self.pool_size)
+                ]
+                sessions_ready.set_result(sessions)
+                await closing.wait()
+        except BaseException as e:
+            if sessions_ready.done():
+                raise
+            # Connecting failed; report it to connect() rather than the task
+            if isinstance(e, asyncio.CancelledError):
+                sessions_ready.cancel()
+            else:
+                sessions_ready.set_exception(e)
+
+    @staticmethod
+    async def _open_session(
+        exit_stack: contextlib.AsyncExitStack, server: StdioServerParameters
+    ) -> ClientSession:
+        """Start a server process and initialize a session on it."""
+        read_stream, write_stream = await exit_stack.enter_async_context(
+            stdio_client(server)
+        )
+        session = await exit_stack.enter_async_context(
+            ClientSession(read_stream, write_stream)
+        )
+        await session.initialize()
+        return session
 
     async def disconnect(self):
         """Disconnect from the MCP server."""
-        if self.session is not None:
-            await self.session.close()
-            self.session = None
+        self._bind_to_running_loop()
+        async with self._lifecycle_lock:
+            await self._disconnect()
+
+    async def _disconnect(self):
+        """Close the server sessions; the caller holds the lifecycle lock."""
+        owner_task, closing = self._owner_task, self._closing
+        if owner_task is None or closing is None:
+            return
+        self._owner_task = None
+        self._closing = None
+        self.session = None
+        self._sessions = []
+        self._next_session = None
+        closing.set()
+        await owner_task
 
     async def fetch_user_token_by_scopes(
         self,
@@ -184,6 +319,46 @@ class DescopeMCPClient:
         result = await self._call_tool("fetch_tenant_token", arguments)
         return self._parse_token_response(result)
 
+    async def fetch_tokens_bulk(
+        self, requests: List[UserTokenRequest]
+    ) -> List[TokenResponse]:
+        """Fetch several user tokens concurrently.
+
+        Requests with scopes use fetch_user_token_by_scopes, the others
+        fetch_user_token.
+
+        Args:
+            requests: User token requests
+
+        Returns:
+            Token responses, in the same order as requests
+
+        Raises:
+            Exception: If any request fails
+        """
+        calls = []
+        for request in requests:
+            if request.scopes:
+                calls.append(
+                    self.fetch_user_token_by_scopes(
+                        app_id=request.app_id,
+                        user_id=request.user_id,
+                        scopes=request.scopes,
+                        options=request.options,
+                        tenant_id=request.tenant_id,
+                    )
+                )
+            else:
+                calls.append(
+                    self.fetch_user_token(
+                        app_id=request.app_id,
+                        user_id=request.user_id,
+                        tenant_id=request.tenant_id,
+                        options=request.options,
+                    )
+                )
+        return list(await asyncio.gather(*calls))
+
     async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> str:
         """Call a tool on the MCP server.
 
@@ -197,21 +372,22 @@ class DescopeMCPClient:
         Raises:
             Exception: If the tool call fails
         """
-        if self.session is None:
+        # Sessions left over from a closed loop are dropped here too
+        self._bind_to_running_loop()
+        if self._next_session is None:
             raise RuntimeError("Client not connected. Call connect() first.")
 
-        request = CallToolRequest(name=name, arguments=arguments)
-        result = await self.session.call_tool(request)
+        session = next(self._next_session)
+        result = await session.call_tool(name, arguments)
 
         if not result.content:
             raise Exception("No content in tool result")
 
-        # Extract text content
-        text_content = None
-        for content in result.content:
-            if content.get("type") == "text":
-                text_content = content.get("text", "")
-                break
+        # Extract the first text content item
+        text_content = next(
+            (content.text for content in result.content if content.type == "text"),
+            None,
+        )
 
         if text_content is None:
             raise Exception("No text content in tool result")
@@ -248,16 +424,43 @@ class DescopeMCPClient:
             raise
 
 
-def create_client(server_command: List[str]) -> DescopeMCPClient:
+# Shared clients by server command and pool size. Never evicted, so a client in
+# use elsewhere isn't dropped while its server processes are still running.
+_shared_clients: Dict[Tuple[Tuple[str, ...], int], DescopeMCPClient] = {}
+
+
+def _get_or_create_client(
+    server_command: Tuple[str, ...], pool_size: int
+) -> DescopeMCPClient:
+    """Get the shared client for a server command, creating it once."""
+    key = (server_command, pool_size)
+    client = _shared_clients.get(key)
+    if client is None:
+        client = _shared_clients.setdefault(
+            key, DescopeMCPClient(list(server_command), pool_size=pool_size)
+        )
+    return client
+
+
+def create_client(
+    server_command: Sequence[str], pool_size: int = 1
+) -> DescopeMCPClient:
     """Create a Descope MCP client instance.
 
+    Clients are shared per server command and pool size, so calling this
+    repeatedly reuses the same client (and its server sessions once connected).
+    A shared client can be used again from a later event loop once the loop it
+    last connected on has closed, e.g. across asyncio.run() calls.
+    Instantiate DescopeMCPClient directly for an independent client.
+
     Args:
         server_command: Command to start the MCP server
+        pool_size: Number of server sessions to keep open
 
     Returns:
         Configured Descope MCP client
     """
-    return DescopeMCPClient(server_command)
+    return _get_or_create_client(tuple(server_command), pool_size)
 
 
 # Convenience function for creating client with default server command
@@ -271,52 +474,66 @@ def create_default_client() -> DescopeMCPClient:
 
 
 # Example usage functions
-async def example_usage():
-    """Example usage of the Descope MCP client."""
-    # Create client
-    client = create_default_client()
+async def example_usage(client: Optional[DescopeMCPClient] = None):
+    """Example usage of the Descope MCP client.
 
-    try:
-        async with client:
-            # Fetch user token with scopes
-            user_token = await client.fetch_user_token_by_scopes(
-                app_id="my-app-id",
-                user_id="user-id",
-                scopes=["read", "write"],
-                options={"refreshToken": True},
-                tenant_id="tenant-id",
-            )
-            print(f"User token: {user_token.token}")
-
-            # Fetch latest user token
-            latest_user_token = await client.fetch_user_token(
-                app_id="my-app-id",
-                user_id="user-id",
-                tenant_id="tenant-id",
-                options={"forceRefresh": True},
-            )
-            print(f"Latest user token: {latest_user_token.token}")
-
-            # Fetch tenant token with scopes
-            tenant_token = await client.fetch_tenant_token_by_scopes(
-                app_id="my-app-id",
-                tenant_id="tenant-id",
-                scopes=["read", "write"],
-                options={"refreshToken": True},
-            )
-            print(f"Tenant token: {tenant_token.token}")
+    Args:
+        client: Optional connected client to reuse. It is left open for the caller;
+            if not provided, a default client is created and closed here.
+    """
+    owns_client = client is None
+    if client is None:
+        client = create_default_client()
 
-            # Fetch latest tenant token
-            latest_tenant_token = await client.fetch_tenant_token(
-                app_id="my-app-id",
-                tenant_id="tenant-id",
-                options={"forceRefresh": True},
-            )
-            print(f"Latest tenant token: {latest_tenant_token.token}")
+    try:
+        async with client if owns_client else contextlib.nullcontext(client):
+            # The fetches are independent, so dispatch them concurrently
+            requests = {
+                "User token": client.fetch_user_token_by_scopes(
+                    app_id="my-app-id",
+                    user_id="user-id",
+                    scopes=["read", "write"],
+                    options={"refreshToken": True},
+                    tenant_id="tenant-id",
+                ),
+                "Latest user token": client.fetch_user_token(
+                    app_id="my-app-id",
+                    user_id="user-id",
+                    tenant_id="tenant-id",
+                    options={"forceRefresh": True},
+                ),
+                "Tenant token": client.fetch_tenant_token_by_scopes(
+                    app_id="my-app-id",
+                    tenant_id="tenant-id",
+                    scopes=["read", "write"],
+                    options={"refreshToken": True},
+                ),
+                "Latest tenant token": client.fetch_tenant_token(
+                    app_id="my-app-id",
+                    tenant_id="tenant-id",
+                    options={"forceRefresh": True},
+                ),
+            }
+
+            # return_exceptions=True keeps one failure from cancelling the others
+            results = await asyncio.gather(*requests.values(), return_exceptions=True)
+            for label, result in zip(requests, results):
+                if isinstance(result, BaseException):
+                    logger.error("%s error: %s", label, result)
+                else:
+                    logger.info("%s: %s", label, result.token)
 
     except Exception as e:
-        print(f"Error: {e}")
+        logger.error("Error: %s", e)
 
 
 if __name__ == "__main__":
-    asyncio.run(example_usage())
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Prefer the libuv-based event loop when uvloop is installed; imported here so
+    # importing the library doesn't pay for it
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(example_usage())
+    else:
+        uvloop.run(example_usage())
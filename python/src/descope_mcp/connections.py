@@ -4,8 +4,31 @@ This module provides functions for retrieving OAuth access tokens for
 outbound applications (connections) configured in Descope.
 """
 
+import asyncio
+import atexit
+import base64
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import re
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeAlias,
+)
 from urllib.parse import urlparse
 
 try:
@@ -13,21 +36,509 @@ try:
 except ImportError:
     httpx = None
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:  # pragma: no cover
     from descope import DescopeClient
 else:  # pragma: no cover
     DescopeClient = Any  # type: ignore
 
+from .cache import ExpiringCache
+from .types import UserTokenRequest
 
-# Import context lazily to avoid circular dependency
-def _get_context():
-    from .descope_mcp import _context
+# Import context lazily to avoid circular dependency, keeping the module once loaded
+_descope_mcp_module: Any = None
 
-    return _context
+
+def _get_context():
+    global _descope_mcp_module
+    if _descope_mcp_module is None:
+        from . import descope_mcp as _descope_mcp_module
+    return _descope_mcp_module._context
 
 
 logger = logging.getLogger(__name__)
 
+# Connection tokens fetched with an MCP access token are reused until shortly
+# before they expire, so hot tools don't round-trip Descope on every call.
+# Within the refresh window the cached token is still served while a fresh one
+# is fetched in the background.
+_CONNECTION_TOKEN_CACHE_MAX_SIZE = 1024
+_CONNECTION_TOKEN_REFRESH_SKEW = 300  # seconds
+_CONNECTION_TOKEN_EXPIRY_SKEW = 60  # seconds
+# Upper bound on how long a token is trusted; tokens whose expiry is unknown
+# (no expiry field and not a JWT) are not cached at all
+_CONNECTION_TOKEN_MAX_TTL = 3300  # seconds
+
+# After a background refresh starts, the next one is held off this long, so a
+# failing refresh is retried periodically rather than on every call
+_CONNECTION_TOKEN_REFRESH_RETRY = 30  # seconds
+
+# Values are (token, refresh_at, expires_at)
+_connection_token_cache: ExpiringCache[Tuple[str, float, float]] = ExpiringCache(
+    maxsize=_CONNECTION_TOKEN_CACHE_MAX_SIZE
+)
+
+# DescopeClient instances built from project_id/management_key, keyed by a digest
+# of the key so the SDK client (and its HTTP session) is set up only once.
+_descope_clients: Dict[Tuple[str, bytes], DescopeClient] = {}
+_descope_clients_lock = threading.Lock()
+
+
+def _get_management_client(project_id: str, management_key: str) -> DescopeClient:
+    """Get the DescopeClient for a project and management key, creating it once."""
+    key = (
+        project_id,
+        hashlib.blake2b(management_key.encode(), digest_size=16).digest(),
+    )
+    with _descope_clients_lock:
+        client = _descope_clients.get(key)
+        if client is None:
+            # Imported on first use; the descope SDK is only needed on this path
+            from descope import DescopeClient
+
+            client = _descope_clients[key] = DescopeClient(
+                project_id=project_id,
+                management_key=management_key,
+            )
+        return client
+
+
+# Sent with every request on the shared clients, so callers only add Authorization
+_DEFAULT_REQUEST_HEADERS = {"Content-Type": "application/json"}
+
+
+# Pooled client for Descope API calls, so repeated fetches reuse keep-alive
+# connections instead of a new TCP/TLS handshake per request.
+_http_client: Optional["httpx.Client"] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> "httpx.Client":
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    with _http_client_lock:
+        if _http_client is None:
+            _http_client = httpx.Client(
+                http2=importlib.util.find_spec("h2") is not None,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                headers=_DEFAULT_REQUEST_HEADERS,
+            )
+            atexit.register(_http_client.close)
+        return _http_client
+
+
+# httpx.AsyncClient is bound to the event loop it first runs on, so keep one per
+# loop, along with the async generator that closes it when asyncio.run() finishes
+_AsyncHttpClientEntry: TypeAlias = Tuple["httpx.AsyncClient", AsyncIterator[None]]
+_async_http_clients: Dict[asyncio.AbstractEventLoop, _AsyncHttpClientEntry] = {}
+
+
+async def _close_on_loop_shutdown(client: "httpx.AsyncClient") -> AsyncIterator[None]:
+    """Close the client when the loop finalizes async generators.
+
+    Best-effort fallback for callers that never call aclose_http_clients():
+    asyncio.run() runs loop.shutdown_asyncgens() before closing the loop, but
+    loops driven some other way may never reach this finally block.
+    """
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def _get_async_http_client() -> "httpx.AsyncClient":
+    """Get the shared async HTTP client for the running event loop."""
+    loop = asyncio.get_running_loop()
+    entry = _async_http_clients.get(loop)
+    if entry is None or entry[0].is_closed:
+        # Drop clients of loops that closed without aclose_http_clients(), so
+        # they and the loops they reference can be garbage collected
+        for stale_loop in [other for other in _async_http_clients if other.is_closed()]:
+            del _async_http_clients[stale_loop]
+        client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+            headers=_DEFAULT_REQUEST_HEADERS,
+        )
+        closer = _close_on_loop_shutdown(client)
+        # Start the generator on the loop so it is registered for shutdown;
+        # the loop only holds it weakly, so keep it alongside the client
+        asyncio.ensure_future(closer.__anext__())
+        entry = _async_http_clients[loop] = (client, closer)
+    return entry[0]
+
+
+async def aclose_http_clients() -> None:
+    """Close the SDK's async HTTP client for the running event loop.
+
+    Call this on server shutdown (e.g. from a FastMCP lifespan) so pooled
+    keep-alive connections are released before the loop closes. A later async
+    call on the same loop opens a new client.
+    """
+    entry = _async_http_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[0].aclose()
+
+
+def _connection_token_cache_key(
+    project_id: str,
+    user_id: str,
+    app_id: str,
+    scopes: Optional[List[str]],
+    tenant_id: Optional[str],
+    access_token: str,
+) -> Tuple[Hashable, ...]:
+    """Build a connection token cache key without keeping the raw access token."""
+    token_digest = hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+    return (
+        project_id,
+        user_id,
+        app_id,
+        tuple(sorted(scopes)) if scopes else None,
+        tenant_id,
+        token_digest,
+    )
+
+
+def _jwt_expiry(token: Any) -> Optional[float]:
+    """Read the ``exp`` claim of a JWT without verifying it, if the token is one."""
+    if not isinstance(token, str) or token.count(".") != 2:
+        return None
+    payload = token.split(".")[1]
+    try:
+        claims = json.loads(
+            base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        )
+    except (ValueError, TypeError):
+        return None
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    return float(exp) if isinstance(exp, (int, float)) else None
+
+
+def _parse_expiry(value: Any) -> Optional[float]:
+    """Parse an expiry given as a Unix timestamp or an ISO-8601 string."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    return None
+
+
+def _connection_token_expiry(token_info: Dict[str, Any]) -> Optional[float]:
+    """Get a connection token's expiry (Unix timestamp) from a Descope response.
+
+    Uses ``accessTokenExpiry`` (Unix timestamp or ISO-8601) or a relative
+    ``expiresIn`` when present, then the token's own ``exp`` claim if it is a JWT.
+    The result never lies more than ``_CONNECTION_TOKEN_MAX_TTL`` seconds ahead.
+    Returns None when the expiry can't be determined, e.g. for an opaque token
+    without an expiry field, which may already be close to expiring.
+    """
+    now = time.time()
+    expiry = _parse_expiry(token_info.get("accessTokenExpiry"))
+    if expiry is None:
+        expires_in = _parse_expiry(token_info.get("expiresIn"))
+        if expires_in is not None:
+            expiry = now + expires_in
+    if expiry is None:
+        expiry = _jwt_expiry(token_info.get("accessToken"))
+    if expiry is None:
+        return None
+    return min(expiry, now + _CONNECTION_TOKEN_MAX_TTL)
+
+
+# Project ID as the first path segment of the documented well-known URL shape
+_PROJECT_ID_RE = re.compile(r"^https?://[^/?#]+/([^/?#]+)/")
+
+
+# The well-known URL rarely changes, so parse each distinct one only once
+@functools.lru_cache(maxsize=32)
+def _extract_project_id(well_known_url: str) -> Optional[str]:
+    """Extract project ID from well-known URL."""
+    match = _PROJECT_ID_RE.match(well_known_url)
+    if match:
+        return match.group(1)
+    try:
+        parsed = urlparse(well_known_url)
+        path_parts = [p for p in parsed.path.split("/") if p]
+        # Well-known URL format: /{project_id}/.well-known/openid-configuration
+        if len(path_parts) > 0:
+            return path_parts[0]
+    except Exception:
+        pass
+    return None
+
+
+def _resolve_project_id(project_id: Optional[str]) -> str:
+    """Get the project ID for access token requests, falling back to the global config."""
+    if not httpx:
+        raise ImportError(
+            "httpx is required for access token authentication. "
+            "Install with: pip install httpx"
+        )
+
+    # Get project_id from parameter, context, or extract from well_known_url
+    proj_id = project_id
+    if not proj_id:
+        context = _get_context()
+        config = context.get_config()
+        if config:
+            proj_id = _extract_project_id(config.well_known_url)
+
+    if not proj_id:
+        raise ValueError(
+            "project_id is required when using access_token. "
+            "Either provide project_id parameter or initialize DescopeMCP() with well_known_url "
+            "(project_id will be extracted from the URL)."
+        )
+    return proj_id
+
+
+def _build_access_token_request(
+    user_id: str,
+    app_id: str,
+    scopes: Optional[List[str]],
+    tenant_id: Optional[str],
+    options: Optional[Dict[str, Any]],
+    access_token: str,
+    proj_id: str,
+) -> Tuple[str, Dict[str, str], Dict[str, Any]]:
+    """Build the REST request for fetching a connection token with an access token.
+
+    Only called on cache misses and refreshes, so cache hits skip building it.
+
+    Returns:
+        Tuple of (url, headers, payload)
+    """
+    base_url = "https://api.descope.com"
+    if scopes:
+        url = f"{base_url}/v1/mgmt/outbound/app/user/token"
+        payload = {
+            "appId": app_id,
+            "userId": user_id,
+            "scopes": scopes,
+            "options": options or {},
+        }
+    else:
+        url = f"{base_url}/v1/mgmt/outbound/app/user/token/latest"
+        payload = {"appId": app_id, "userId": user_id, "options": options or {}}
+
+    if tenant_id:
+        payload["tenantId"] = tenant_id
+
+    # Content-Type is a default header of the shared HTTP clients
+    headers = {"Authorization": f"Bearer {proj_id}:{access_token}"}
+    return url, headers, payload
+
+
+def _response_json(response: "httpx.Response") -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _store_connection_token(
+    result: Dict[str, Any], cache_key: Optional[Tuple[Hashable, ...]]
+) -> str:
+    """Extract the connection token from a Descope response, caching it if allowed."""
+    token_info = result["token"]
+    connection_token = token_info["accessToken"]
+    if cache_key is not None:
+        expiry = _connection_token_expiry(token_info)
+        if expiry is not None:
+            expires_at = expiry - _CONNECTION_TOKEN_EXPIRY_SKEW
+            _connection_token_cache.set(
+                cache_key,
+                (
+                    connection_token,
+                    expiry - _CONNECTION_TOKEN_REFRESH_SKEW,
+                    expires_at,
+                ),
+                expires_at=expires_at,
+            )
+    return connection_token
+
+
+# Concurrent cache misses for the same key share one in-flight Descope request
+_inflight_requests: Dict[Tuple[Hashable, ...], "Future[str]"] = {}
+_inflight_requests_lock = threading.Lock()
+_inflight_async_requests: Dict[Tuple[Hashable, ...], "asyncio.Task[str]"] = {}
+
+
+def _request_connection_token(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[Tuple[Hashable, ...]],
+) -> str:
+    """POST a connection token request to Descope and store the result."""
+    response = _get_http_client().post(url, headers=headers, json=payload)
+    response.raise_for_status()
+    return _store_connection_token(_response_json(response), cache_key)
+
+
+async def _request_connection_token_async(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[Tuple[Hashable, ...]],
+) -> str:
+    """Async variant of _request_connection_token()."""
+    response = await _get_async_http_client().post(url, headers=headers, json=payload)
+    response.raise_for_status()
+    return _store_connection_token(_response_json(response), cache_key)
+
+
+def _fetch_connection_token(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[Tuple[Hashable, ...]],
+) -> str:
+    """Fetch a connection token, letting concurrent callers share one request."""
+    if cache_key is None:
+        return _request_connection_token(url, headers, payload, cache_key)
+
+    with _inflight_requests_lock:
+        future = _inflight_requests.get(cache_key)
+        is_leader = future is None
+        if future is None:
+            future = _inflight_requests[cache_key] = Future()
+    if not is_leader:
+        return future.result()
+
+    try:
+        token = _request_connection_token(url, headers, payload, cache_key)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(token)
+        return token
+    finally:
+        with _inflight_requests_lock:
+            _inflight_requests.pop(cache_key, None)
+
+
+def _connection_token_task(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Tuple[Hashable, ...],
+) -> "asyncio.Task[str]":
+    """Get the in-flight fetch for cache_key on the running loop, starting one if needed."""
+    # Tasks belong to their event loop, so only share them within one loop
+    key = (asyncio.get_running_loop(), *cache_key)
+    task = _inflight_async_requests.get(key)
+    if task is None:
+        task = asyncio.ensure_future(
+            _request_connection_token_async(url, headers, payload, cache_key)
+        )
+        _inflight_async_requests[key] = task
+
+        def _done(finished: "asyncio.Task[str]") -> None:
+            _inflight_async_requests.pop(key, None)
+            # Mark the outcome as retrieved even if every waiter was cancelled
+            if not finished.cancelled():
+                finished.exception()
+
+        task.add_done_callback(_done)
+    return task
+
+
+async def _fetch_connection_token_async(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Optional[Tuple[Hashable, ...]],
+) -> str:
+    """Async variant of _fetch_connection_token()."""
+    if cache_key is None:
+        return await _request_connection_token_async(url, headers, payload, cache_key)
+
+    # Shield so one caller being cancelled doesn't cancel the shared request
+    return await asyncio.shield(
+        _connection_token_task(url, headers, payload, cache_key)
+    )
+
+
+_refresh_claim_lock = threading.Lock()
+
+
+def _claim_connection_token_refresh(cache_key: Tuple[Hashable, ...]) -> bool:
+    """Claim a due background refresh, pushing the entry's next refresh back.
+
+    Returns False if the entry is gone or another caller already claimed it.
+    """
+    with _refresh_claim_lock:
+        cached = _connection_token_cache.get(cache_key)
+        now = time.time()
+        if cached is None or cached[1] > now:
+            return False
+        token, _, expires_at = cached
+        _connection_token_cache.set(
+            cache_key,
+            (token, now + _CONNECTION_TOKEN_REFRESH_RETRY, expires_at),
+            expires_at=expires_at,
+        )
+        return True
+
+
+def _refresh_connection_token(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Tuple[Hashable, ...],
+) -> None:
+    """Refresh a cached connection token in a background thread."""
+    with _inflight_requests_lock:
+        if cache_key in _inflight_requests:
+            return
+
+    def _run() -> None:
+        try:
+            _fetch_connection_token(url, headers, payload, cache_key)
+        except Exception as e:
+            logger.warning("Background connection token refresh failed: %s", e)
+
+    threading.Thread(
+        target=_run, name="descope-connection-token-refresh", daemon=True
+    ).start()
+
+
+def _refresh_connection_token_async(
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    cache_key: Tuple[Hashable, ...],
+) -> None:
+    """Refresh a cached connection token in a background task."""
+    if (asyncio.get_running_loop(), *cache_key) in _inflight_async_requests:
+        return
+
+    def _log_failure(task: "asyncio.Task[str]") -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Background connection token refresh failed: %s", task.exception()
+            )
+
+    _connection_token_task(url, headers, payload, cache_key).add_done_callback(
+        _log_failure
+    )
+
 
 def get_connection_token(
     user_id: str,
@@ -54,6 +565,13 @@ def get_connection_token(
     2. DescopeClient instance (uses its configured management key)
     3. project_id and management_key directly (fallback for tenant tokens)
 
+    Tokens fetched with an access token are cached until shortly before they
+    expire, and concurrent cache misses for the same token share one request.
+    Once a cached token nears expiry it is still returned while a replacement
+    is fetched in the background.
+    Calls that pass ``options`` (e.g. ``{"refreshToken": True}``) always go to
+    Descope.
+
     Args:
         user_id: User ID from the validated MCP server token
         app_id: Connection/outbound application ID configured in Descope
@@ -103,78 +621,44 @@ def get_connection_token(
         ```
     """
     try:
-        # Extract project_id from well_known_url if needed
-        def _extract_project_id(well_known_url: str) -> Optional[str]:
-            """Extract project ID from well-known URL."""
-            try:
-                parsed = urlparse(well_known_url)
-                path_parts = [p for p in parsed.path.split("/") if p]
-                # Well-known URL format: /{project_id}/.well-known/openid-configuration
-                if len(path_parts) > 0:
-                    return path_parts[0]
-            except Exception:
-                pass
-            return None
-
         # Priority 1: Use MCP server access token (default, recommended)
         if access_token:
-            if not httpx:
-                raise ImportError(
-                    "httpx is required for access token authentication. "
-                    "Install with: pip install httpx"
-                )
-
-            # Get project_id from parameter, context, or extract from well_known_url
-            proj_id = project_id
-            if not proj_id:
-                context = _get_context()
-                config = context.get_config()
-                if config:
-                    proj_id = _extract_project_id(config.well_known_url)
-
-            if not proj_id:
-                raise ValueError(
-                    "project_id is required when using access_token. "
-                    "Either provide project_id parameter or initialize DescopeMCP() with well_known_url "
-                    "(project_id will be extracted from the URL)."
+            proj_id = _resolve_project_id(project_id)
+            request_args = (
+                user_id,
+                app_id,
+                scopes,
+                tenant_id,
+                options,
+                access_token,
+                proj_id,
+            )
+            cache_key = None
+            if not options:
+                cache_key = _connection_token_cache_key(
+                    proj_id, user_id, app_id, scopes, tenant_id, access_token
                 )
+                cached = _connection_token_cache.get(cache_key)
+                if cached is not None:
+                    cached_token, refresh_at, _ = cached
+                    if refresh_at <= time.time() and _claim_connection_token_refresh(
+                        cache_key
+                    ):
+                        _refresh_connection_token(
+                            *_build_access_token_request(*request_args), cache_key
+                        )
+                    return cached_token
 
-            # Make REST API call using access token
-            base_url = "https://api.descope.com"
-            if scopes:
-                url = f"{base_url}/v1/mgmt/outbound/app/user/token"
-                payload = {
-                    "appId": app_id,
-                    "userId": user_id,
-                    "scopes": scopes,
-                    "options": options or {},
-                }
-            else:
-                url = f"{base_url}/v1/mgmt/outbound/app/user/token/latest"
-                payload = {"appId": app_id, "userId": user_id, "options": options or {}}
-
-            if tenant_id:
-                payload["tenantId"] = tenant_id
-
-            headers = {
-                "Authorization": f"Bearer {proj_id}:{access_token}",
-                "Content-Type": "application/json",
-            }
-
-            response = httpx.post(url, headers=headers, json=payload, timeout=30.0)
-            response.raise_for_status()
-            result = response.json()
-            return result["token"]["accessToken"]
+            return _fetch_connection_token(
+                *_build_access_token_request(*request_args), cache_key
+            )
 
         # Priority 2: Use DescopeClient (management key)
         if descope_client:
             client = descope_client
         elif project_id and management_key:
-            # Create DescopeClient with provided credentials
-            client = DescopeClient(
-                project_id=project_id,
-                management_key=management_key,
-            )
+            # Reuse the DescopeClient for these credentials
+            client = _get_management_client(project_id, management_key)
         else:
             # Try to use global context
             context = _get_context()
@@ -205,3 +689,147 @@ def get_connection_token(
         return token
     except Exception as e:
         raise Exception(f"Failed to get connection token: {e}")
+
+
+async def get_connection_token_async(
+    user_id: str,
+    app_id: str,
+    scopes: Optional[List[str]] = None,
+    tenant_id: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    access_token: Optional[str] = None,
+    descope_client: Optional[DescopeClient] = None,
+    project_id: Optional[str] = None,
+    management_key: Optional[str] = None,
+) -> str:
+    """Get connection token from Descope for a user without blocking the event loop.
+
+    Async variant of get_connection_token() with the same arguments, caching and
+    authentication methods. Access-token requests use a pooled httpx.AsyncClient;
+    the management key methods run the synchronous Descope SDK in a worker thread.
+
+    Returns:
+        Connection access token string
+
+    Raises:
+        ValueError: If no authentication method is available
+        Exception: If token retrieval fails
+
+    Example:
+        ```python
+        from descope_mcp import get_connection_token_async
+
+        @mcp.tool()
+        async def my_tool(mcp_access_token: str) -> str:
+            google_token = await get_connection_token_async(
+                user_id="user-123",
+                app_id="google-calendar",
+                access_token=mcp_access_token,
+            )
+        ```
+    """
+    if not access_token:
+        return await asyncio.to_thread(
+            get_connection_token,
+            user_id=user_id,
+            app_id=app_id,
+            scopes=scopes,
+            tenant_id=tenant_id,
+            options=options,
+            descope_client=descope_client,
+            project_id=project_id,
+            management_key=management_key,
+        )
+
+    try:
+        proj_id = _resolve_project_id(project_id)
+        request_args = (
+            user_id,
+            app_id,
+            scopes,
+            tenant_id,
+            options,
+            access_token,
+            proj_id,
+        )
+        cache_key = None
+        if not options:
+            cache_key = _connection_token_cache_key(
+                proj_id, user_id, app_id, scopes, tenant_id, access_token
+            )
+            cached = _connection_token_cache.get(cache_key)
+            if cached is not None:
+                cached_token, refresh_at, _ = cached
+                if refresh_at <= time.time() and _claim_connection_token_refresh(
+                    cache_key
+                ):
+                    _refresh_connection_token_async(
+                        *_build_access_token_request(*request_args), cache_key
+                    )
+                return cached_token
+
+        return await _fetch_connection_token_async(
+            *_build_access_token_request(*request_args), cache_key
+        )
+    except Exception as e:
+        raise Exception(f"Failed to get connection token: {e}")
+
+
+async def get_connection_tokens_bulk(
+    requests: Iterable[UserTokenRequest],
+    access_token: Optional[str] = None,
+    descope_client: Optional[DescopeClient] = None,
+    project_id: Optional[str] = None,
+    management_key: Optional[str] = None,
+    max_concurrency: int = 10,
+) -> List[str]:
+    """Get several connection tokens concurrently.
+
+    Each request is fetched with get_connection_token_async() using the shared
+    authentication arguments, with at most ``max_concurrency`` requests in flight.
+
+    Args:
+        requests: Token requests (user_id, app_id and optional scopes, tenant_id, options)
+        access_token: MCP server access token (default method, enables policy enforcement)
+        descope_client: Optional DescopeClient instance (fallback to management key)
+        project_id: Optional project ID (required if using management_key)
+        management_key: Optional management key (fallback method)
+        max_concurrency: Maximum number of requests sent to Descope at once
+
+    Returns:
+        Connection access tokens, in the same order as requests
+
+    Raises:
+        ValueError: If no authentication method is available
+        Exception: If any token retrieval fails
+
+    Example:
+        ```python
+        from descope_mcp import UserTokenRequest, get_connection_tokens_bulk
+
+        google_token, slack_token = await get_connection_tokens_bulk(
+            [
+                UserTokenRequest(user_id="user-123", app_id="google-calendar"),
+                UserTokenRequest(user_id="user-123", app_id="slack"),
+            ],
+            access_token=mcp_access_token,
+        )
+        ```
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _fetch(request: UserTokenRequest) -> str:
+        async with semaphore:
+            return await get_connection_token_async(
+                user_id=request.user_id,
+                app_id=request.app_id,
+                scopes=request.scopes,
+                tenant_id=request.tenant_id,
+                options=request.options,
+                access_token=access_token,
+                descope_client=descope_client,
+                project_id=project_id,
+                management_key=management_key,
+            )
+
+    return list(await asyncio.gather(*(_fetch(request) for request in requests)))
@@ -8,9 +8,25 @@ This module provides the main DescopeMCP client class and SDK functionality incl
 - Utility functions for headers and SDK configuration
 """
 
+import asyncio
+import functools
 import logging
+import os
 import platform
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+import re
+import sys
+from contextlib import asynccontextmanager
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+)
 from urllib.parse import urlparse
 
 try:
@@ -37,6 +53,13 @@ else:  # pragma: no cover
 from mcp.server import FastMCP
 
 from . import __version__
+from .connections import (
+    _extract_project_id,
+    _get_async_http_client,
+    _get_management_client,
+    _response_json,
+    aclose_http_clients,
+)
 from .connections import get_connection_token as _get_connection_token
 from .session import (
     TokenValidationResult,
@@ -51,9 +74,16 @@ from .types import DescopeConfig, ErrorResponse, TokenResponse
 
 logger = logging.getLogger(__name__)
 
+# Fixed for the life of the process, so read once rather than per request
+_PYTHON_VERSION = platform.python_version()
 
+
+@functools.lru_cache(maxsize=None)
 def _get_sdk_version() -> str:
-    """Get the version of this SDK."""
+    """Get the version of this SDK.
+
+    The result is cached, since package metadata lookups scan ``sys.path``.
+    """
     try:
         # First try to get from package metadata
         return _get_version("descope-mcp")  # type: ignore
@@ -65,6 +95,17 @@ def _get_sdk_version() -> str:
             return "unknown"
 
 
+@functools.lru_cache(maxsize=None)
+def _build_default_headers() -> Dict[str, str]:
+    """Build the default headers once; callers get copies via _get_default_headers()."""
+    return {
+        "Content-Type": "application/json",
+        "x-descope-sdk-name": "mcp-python",
+        "x-descope-sdk-python-version": _PYTHON_VERSION,
+        "x-descope-sdk-version": _get_sdk_version(),
+    }
+
+
 def _get_default_headers() -> Dict[str, str]:
     """Get default headers for MCP Descope SDK requests (internal use only).
 
@@ -82,16 +123,17 @@ def _get_default_headers() -> Dict[str, str]:
     - Authorization: Bearer <project-id>:<management-key>
 
     Returns:
-        Dictionary of default headers (for internal SDK use only)
+        Dictionary of default headers (for internal SDK use only); a fresh copy
+        that callers may modify
     """
-    return {
-        "Content-Type": "application/json",
-        "x-descope-sdk-name": "mcp-python",
-        "x-descope-sdk-python-version": platform.python_version(),
-        "x-descope-sdk-version": _get_sdk_version(),
-    }
+    return dict(_build_default_headers())
+
 
+# Project ID as the first path segment of the documented well-known URL shape
+_PROJECT_ID_RE = re.compile(r"^https?://[^/?#]+/(P[^/?#]+)/")
 
+
+@functools.lru_cache(maxsize=32)
 def _extract_project_id_from_url(url: str) -> Optional[str]:
     """Extract project ID from well-known URL.
 
@@ -101,15 +143,18 @@ def _extract_project_id_from_url(url: str) -> Optional[str]:
     Returns:
         Project ID or None if not found
     """
+    match = _PROJECT_ID_RE.match(url)
+    if match:
+        return match.group(1)
     try:
-        parsed_url = urlparse(url)
-        path_parts = [p for p in parsed_url.path.split("/") if p]
+        path = urlparse(url).path
         # Project ID is typically the first part after the domain
         # Format: /P123456/.well-known/openid-configuration
-        for part in path_parts:
-            if part.startswith("P") and len(part) > 1:
-                return part
-        return None
+        # Empty segments fail the length check, so no separate filter is needed
+        return next(
+            (part for part in path.split("/") if len(part) > 1 and part[0] == "P"),
+            None,
+        )
     except Exception:
         return None
 
@@ -118,6 +163,9 @@ def _extract_project_id_from_url(url: str) -> Optional[str]:
 class _DescopeContext:
     """Global context for Descope SDK configuration."""
 
+    # Read on every validation, so keep the fields in fixed slots
+    __slots__ = ("config", "client", "mcp_server_url")
+
     def __init__(self):
         self.config: Optional[DescopeConfig] = None
         self.client: Optional[DescopeClient] = None
@@ -224,6 +272,7 @@ class DescopeMCP:
         )
         self.mcp_server_url = mcp_server_url
         self._client = _get_descope_client(self.config, self.mcp_server_url)
+        self._auth_checks: Dict[FrozenSet[str], Callable] = {}
 
     @property
     def descope_client(self) -> Optional[DescopeClient]:
@@ -274,7 +323,7 @@ class DescopeMCP:
     def validate_token_require_scopes_and_get_user_id(
         self,
         access_token: str,
-        required_scopes: List[str],
+        required_scopes: Collection[str],
         audience: Optional[str] = None,
         error_description: Optional[str] = None,
     ) -> str:
@@ -285,7 +334,7 @@ class DescopeMCP:
 
         Args:
             access_token: MCP server access token
-            required_scopes: List of scopes required for the operation
+            required_scopes: Scopes required for the operation (list or set)
             audience: Optional audience claim (defaults to mcp_server_url if set)
             error_description: Optional custom error description
 
@@ -307,7 +356,7 @@ class DescopeMCP:
     def require_scopes(
         self,
         token_result: TokenValidationResult,
-        required_scopes: List[str],
+        required_scopes: Collection[str],
         error_description: Optional[str] = None,
     ) -> None:
         """Validate that token has required scopes, raise InsufficientScopeError if not.
@@ -316,7 +365,7 @@ class DescopeMCP:
 
         Args:
             token_result: Token validation result from validate_token()
-            required_scopes: List of scopes required for the operation
+            required_scopes: Scopes required for the operation (list or set)
             error_description: Optional custom error description
 
         Raises:
@@ -365,19 +414,33 @@ class DescopeMCP:
         )
 
     def create_auth_check(
-        self, required_scopes: Optional[List[str]] = None
+        self, required_scopes: Optional[Collection[str]] = None
     ) -> Callable:
         """Create an auth check function for FastMCP.
 
+        Checks are shared per distinct scope set, so decorating many tools with the
+        same scopes reuses one function.
+
         Args:
-            required_scopes: List of required scopes (empty list means auth only, no scope check)
+            required_scopes: Required scopes, list or set (empty means auth only, no scope check)
 
         Returns:
             Auth check function that can be used with FastMCP decorators
         """
-        return create_auth_check(
-            required_scopes=required_scopes, descope_client=self._client
-        )
+        key = frozenset(required_scopes or ())
+        auth_check = self._auth_checks.get(key)
+        if auth_check is None:
+            auth_check = self._auth_checks[key] = create_auth_check(
+                required_scopes=key, descope_client=self._client
+            )
+        return auth_check
+
+    async def aclose(self) -> None:
+        """Close the SDK's pooled async HTTP client for the running event loop.
+
+        Call this on server shutdown, e.g. from a FastMCP lifespan.
+        """
+        await aclose_http_clients()
 
 
 def init_descope_mcp(
@@ -470,13 +533,11 @@ def _get_descope_client(
     project_id = _extract_project_id_from_url(config.well_known_url)
 
     if project_id:
-        # Initialize DescopeClient with project_id and management_key
+        # Initialize DescopeClient with project_id and management_key, reusing the
+        # client already built for this pair so its HTTP session and keys are shared
         # Note: The MCP server URL (audience) is not passed to DescopeClient initialization,
         # but is stored in the context and used when calling validate_session()
-        return DescopeClient(
-            project_id=project_id,
-            management_key=config.management_key,
-        )
+        return _get_management_client(project_id, config.management_key)
     return None
 
 
@@ -516,7 +577,7 @@ def get_descope_client(config: DescopeConfig) -> DescopeClient:
 
 
 def create_auth_check(
-    required_scopes: Optional[List[str]] = None,
+    required_scopes: Optional[Collection[str]] = None,
     descope_client: Optional[DescopeClient] = None,
 ) -> Callable:
     """Create an auth check function for FastMCP 3.0+ that validates Descope token and scopes.
@@ -528,7 +589,7 @@ def create_auth_check(
     decorator. It validates the MCP server access token and checks for required scopes.
 
     Args:
-        required_scopes: List of required scopes (empty list means auth only, no scope check)
+        required_scopes: Required scopes, list or set (empty means auth only, no scope check)
         descope_client: Optional Descope client instance (uses global context if not provided)
 
     Returns:
@@ -561,7 +622,8 @@ def create_auth_check(
                 "Either call DescopeMCP() first or pass descope_client parameter."
             )
 
-    required_scopes = required_scopes or []
+    # Built once here rather than on every check
+    required_set = frozenset(map(sys.intern, required_scopes or ()))
 
     def check(ctx) -> bool:
         """Check if request has valid token and required scopes."""
@@ -576,32 +638,22 @@ def create_auth_check(
         token_str = token.token if hasattr(token, "token") else str(token)
 
         try:
-            # Get audience from context if available
-            audience = _context.get_mcp_server_url() if descope_client is None else None
-
             # Validate token and get user ID (uses closure's descope_client)
-            # Audience validation ensures token is intended for this MCP server
-            # Import here to avoid circular dependency
-            from .session import validate_token_and_get_user_id
-
-            user_id = validate_token_and_get_user_id(
-                token_str, descope_client, audience=audience
-            )
+            # Audience validation ensures token is intended for this MCP server;
+            # validate_token falls back to the MCP server URL from context
+            _validate_token_and_get_user_id(token_str, descope_client)
 
             # If no scopes required, just check authentication
-            if not required_scopes:
+            if not required_set:
                 return True
 
             # Check if token has required scopes
-            token_scopes = getattr(token, "scopes", [])
+            token_scopes = getattr(token, "scopes", ())
             if isinstance(token_scopes, str):
                 token_scopes = token_scopes.split()
 
             # Verify all required scopes are present
-            required_set = set(required_scopes)
-            token_set = set(token_scopes)
-
-            return required_set.issubset(token_set)
+            return required_set.issubset(token_scopes)
         except Exception as e:
             logger.error(f"Auth check failed: {e}")
             return False
@@ -828,6 +880,39 @@ async def _fetch_user_token_impl(
         return error_response.model_dump_json()
 
 
+async def _post_tenant_token_request(
+    config: DescopeConfig,
+    path: str,
+    payload: Dict[str, Any],
+    access_token: str,
+) -> str:
+    """POST a tenant token request authenticated with an MCP access token.
+
+    Authenticates with `Authorization: Bearer <PROJECT_ID:ACCESS_TOKEN>` and
+    returns the token as a TokenResponse JSON string.
+    """
+    if not httpx:
+        raise ImportError(
+            "httpx is required for access token authentication. Install with: pip install httpx"
+        )
+
+    project_id = _extract_project_id(config.well_known_url)
+    if not project_id:
+        raise ValueError(
+            "Could not extract project_id from well_known_url. "
+            "Expected format: https://api.descope.com/{project_id}/.well-known/openid-configuration"
+        )
+
+    headers = {"Authorization": f"Bearer {project_id}:{access_token}"}
+    resp = await _get_async_http_client().post(
+        f"https://api.descope.com{path}", headers=headers, json=payload
+    )
+    resp.raise_for_status()
+    data = _response_json(resp)
+    token = data["token"]["accessToken"]
+    return TokenResponse(token=token).model_dump_json()
+
+
 async def _fetch_tenant_token_by_scopes_impl(
     descope_client: Optional[DescopeClient],
     config: DescopeConfig,
@@ -842,34 +927,17 @@ async def _fetch_tenant_token_by_scopes_impl(
         # If an MCP access token is provided, use REST API so we can authenticate with
         # `Authorization: Bearer <PROJECT_ID:ACCESS_TOKEN>` (policy-enforced).
         if access_token:
-            if not httpx:
-                raise ImportError(
-                    "httpx is required for access token authentication. Install with: pip install httpx"
-                )
-
-            project_id = _extract_project_id(config.well_known_url)
-            if not project_id:
-                raise ValueError(
-                    "Could not extract project_id from well_known_url. "
-                    "Expected format: https://api.descope.com/{project_id}/.well-known/openid-configuration"
-                )
-
-            url = "https://api.descope.com/v1/mgmt/outbound/app/tenant/token"
-            payload: Dict[str, Any] = {
-                "appId": app_id,
-                "tenantId": tenant_id,
-                "scopes": scopes,
-                "options": options or {},
-            }
-            headers = {
-                "Authorization": f"Bearer {project_id}:{access_token}",
-                "Content-Type": "application/json",
-            }
-            resp = httpx.post(url, headers=headers, json=payload, timeout=30.0)
-            resp.raise_for_status()
-            data = resp.json()
-            token = data["token"]["accessToken"]
-            return TokenResponse(token=token).model_dump_json()
+            return await _post_tenant_token_request(
+                config,
+                "/v1/mgmt/outbound/app/tenant/token",
+                {
+                    "appId": app_id,
+                    "tenantId": tenant_id,
+                    "scopes": scopes,
+                    "options": options or {},
+                },
+                access_token,
+            )
 
         if descope_client:
             token = (
@@ -904,33 +972,12 @@ async def _fetch_tenant_token_impl(
         # POST /v1/mgmt/outbound/app/tenant/token/latest
         # with `Authorization: Bearer <PROJECT_ID:ACCESS_TOKEN>` (or management key).
         if access_token:
-            if not httpx:
-                raise ImportError(
-                    "httpx is required for access token authentication. Install with: pip install httpx"
-                )
-
-            project_id = _extract_project_id(config.well_known_url)
-            if not project_id:
-                raise ValueError(
-                    "Could not extract project_id from well_known_url. "
-                    "Expected format: https://api.descope.com/{project_id}/.well-known/openid-configuration"
-                )
-
-            url = "https://api.descope.com/v1/mgmt/outbound/app/tenant/token/latest"
-            payload: Dict[str, Any] = {
-                "appId": app_id,
-                "tenantId": tenant_id,
-                "options": options or {},
-            }
-            headers = {
-                "Authorization": f"Bearer {project_id}:{access_token}",
-                "Content-Type": "application/json",
-            }
-            resp = httpx.post(url, headers=headers, json=payload, timeout=30.0)
-            resp.raise_for_status()
-            data = resp.json()
-            token = data["token"]["accessToken"]
-            return TokenResponse(token=token).model_dump_json()
+            return await _post_tenant_token_request(
+                config,
+                "/v1/mgmt/outbound/app/tenant/token/latest",
+                {"appId": app_id, "tenantId": tenant_id, "options": options or {}},
+                access_token,
+            )
 
         if descope_client:
             token = descope_client.mgmt.outbound_application.fetch_tenant_token(
@@ -949,20 +996,23 @@ async def _fetch_tenant_token_impl(
         return error_response.model_dump_json()
 
 
-def _extract_project_id(well_known_url: str) -> Optional[str]:
-    """Extract project ID from well-known URL.
+# Lifespans currently open per event loop; the low-level MCP server enters the
+# lifespan once per session, so the shared client closes when the last one exits
+_open_lifespans: Dict[asyncio.AbstractEventLoop, int] = {}
 
-    Expected well-known URL format:
-      https://api.descope.com/{project_id}/.well-known/openid-configuration
-    """
+
+@asynccontextmanager
+async def _http_clients_lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the SDK's async HTTP client once the server's last lifespan exits."""
+    loop = asyncio.get_running_loop()
+    _open_lifespans[loop] = _open_lifespans.get(loop, 0) + 1
     try:
-        parsed = urlparse(well_known_url)
-        path_parts = [p for p in parsed.path.split("/") if p]
-        if path_parts:
-            return path_parts[0]
-    except Exception:
-        return None
-    return None
+        yield
+    finally:
+        _open_lifespans[loop] -= 1
+        if not _open_lifespans[loop]:
+            del _open_lifespans[loop]
+            await aclose_http_clients()
 
 
 def create_descope_fastmcp_server(
@@ -975,7 +1025,8 @@ def create_descope_fastmcp_server(
     Args:
         name: Server name
         config: Descope configuration (if None, will load from environment)
-        **fastmcp_kwargs: Additional arguments to pass to FastMCP constructor
+        **fastmcp_kwargs: Additional arguments to pass to FastMCP constructor.
+            A ``lifespan`` is wrapped so the SDK's HTTP client is closed on shutdown.
 
     Returns:
         Configured FastMCP server with Descope tools
@@ -1000,8 +1051,6 @@ def create_descope_fastmcp_server(
         mcp.run()
         ```
     """
-    import os
-
     if config is None:
         well_known_url = os.getenv("DESCOPE_MCP_WELL_KNOWN_URL", "")
         management_key = os.getenv("DESCOPE_MANAGEMENT_KEY", "")
@@ -1016,6 +1065,18 @@ def create_descope_fastmcp_server(
             management_key=management_key if management_key else None,
         )
 
-    mcp = FastMCP(name, **fastmcp_kwargs)
+    user_lifespan = fastmcp_kwargs.pop("lifespan", None)
+
+    @asynccontextmanager
+    async def lifespan(server: FastMCP) -> AsyncIterator[Any]:
+        async with _http_clients_lifespan(server):
+            if user_lifespan is None:
+                # Same empty context FastMCP's default lifespan provides
+                yield {}
+            else:
+                async with user_lifespan(server) as context:
+                    yield context
+
+    mcp = FastMCP(name, lifespan=lifespan, **fastmcp_kwargs)
     add_descope_tools(mcp, config)
     return mcp
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import os
 from typing import TYPE_CHECKING, Any, Dict
 from urllib.parse import urlparse
 
@@ -56,6 +57,8 @@ class DescopeMCPServer:
             project_id = path_parts[0] if path_parts else None
 
             if project_id:
+                from descope import DescopeClient
+
                 self.descope_client = DescopeClient(
                     project_id=project_id,
                     management_key=config.management_key,
@@ -343,8 +346,6 @@ def create_server(config: DescopeConfig) -> DescopeMCPServer:
 
 async def main():
     """Main entry point for the MCP server."""
-    import os
-
     # Load configuration from environment variables
     well_known_url = os.getenv("DESCOPE_MCP_WELL_KNOWN_URL", "")
     management_key = os.getenv("DESCOPE_MANAGEMENT_KEY", "")
@@ -362,4 +363,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Prefer the libuv-based event loop when uvloop is installed; imported here so
+    # importing the library doesn't pay for it
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,8 +4,32 @@ This module provides functions for validating MCP server access tokens
 and extracting user information from validated tokens.
 """
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, TypedDict
+import re
+import sys
+import threading
+import time
+import weakref
+from concurrent.futures import Future
+from functools import cached_property
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    cast,
+)
+
+from .cache import ExpiringCache
 
 if TYPE_CHECKING:  # pragma: no cover
     from descope import DescopeClient
@@ -28,6 +52,9 @@ class InsufficientScopeError(Exception):
     ):
         """Initialize insufficient scope error.
 
+        The derived scope lists and description are computed on first access,
+        so raising the error stays cheap when it is handled without them.
+
         Args:
             required_scopes: List of scopes required for the operation
             token_scopes: List of scopes present in the token
@@ -35,21 +62,48 @@ class InsufficientScopeError(Exception):
         """
         self.required_scopes = required_scopes
         self.token_scopes = token_scopes
-        self.missing_scopes = list(set(required_scopes) - set(token_scopes))
-
+        self._error_description = error_description
+        # Keep the constructor arguments in args, so the error pickles and
+        # copies like a regular exception
+        super().__init__(required_scopes, token_scopes, error_description)
+
+    @cached_property
+    def _scope_sets(self) -> Tuple[Set[str], Set[str]]:
+        """The required and token scopes as sets, built once for both derived lists."""
+        return set(self.required_scopes), set(self.token_scopes)
+
+    @cached_property
+    def missing_scopes(self) -> List[str]:
+        """Required scopes the token lacks."""
+        required_set, token_set = self._scope_sets
+        return list(required_set - token_set)
+
+    @cached_property
+    def combined_scopes(self) -> List[str]:
+        """Existing scopes plus newly required scopes, sorted."""
         # Recommended approach: Include existing scopes + newly required scopes
         # This prevents clients from losing previously granted permissions
-        self.combined_scopes = sorted(set(token_scopes) | set(required_scopes))
+        required_set, token_set = self._scope_sets
+        return sorted(token_set | required_set)
+
+    @cached_property
+    def scope_parameter(self) -> str:
+        """Combined scopes as a space-separated string (per RFC 6750)."""
+        return " ".join(self.combined_scopes)
 
-        # Format scope parameter as space-separated string (per RFC 6750)
-        self.scope_parameter = " ".join(self.combined_scopes)
+    @cached_property
+    def error_description(self) -> str:
+        """Human-readable error description."""
+        if self._error_description is not None:
+            return self._error_description
+        missing_str = ", ".join(self.missing_scopes)
+        return f"Token missing required scopes: {missing_str}"
 
-        if error_description is None:
-            missing_str = ", ".join(self.missing_scopes)
-            error_description = f"Token missing required scopes: {missing_str}"
+    def __str__(self) -> str:
+        return self.error_description
 
-        self.error_description = error_description
-        super().__init__(self.error_description)
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.error_description!r})"
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert error to dictionary following MCP spec format.
@@ -77,8 +131,6 @@ class InsufficientScopeError(Exception):
         Returns:
             JSON string representation of the error
         """
-        import json
-
         return json.dumps(self.to_dict(), indent=2)
 
 
@@ -114,15 +166,227 @@ class TokenValidationResult(TypedDict, total=False):
     # Using Dict[str, Any] for extensibility
 
 
-# Import context lazily to avoid circular dependency
-def _get_context():
-    from .descope_mcp import _context
+# Import context lazily to avoid circular dependency, keeping the module once loaded
+_descope_mcp_module: Any = None
+
 
-    return _context
+def _get_context():
+    global _descope_mcp_module
+    if _descope_mcp_module is None:
+        from . import descope_mcp as _descope_mcp_module
+    return _descope_mcp_module._context
 
 
 logger = logging.getLogger(__name__)
 
+# Successful validations are cached per DescopeClient, keyed by a digest of the
+# token and the audience, so repeated calls with the same bearer token skip
+# signature verification until shortly before the token expires.
+_TOKEN_CACHE_MAX_SIZE = 1024
+_TOKEN_CACHE_EXPIRY_SKEW = 30  # seconds
+# Long-lived tokens are still re-verified periodically, bounding how long a
+# cached result can outlive a change to the project's signing keys
+_TOKEN_CACHE_MAX_TTL = 300  # seconds
+
+# Rejected tokens (invalid, expired, wrong audience) are remembered briefly, so
+# a client replaying the same bad token doesn't force a signature check each time.
+# Transient failures are never cached.
+_REJECTED_TOKEN_CACHE_MAX_SIZE = 2048
+_REJECTED_TOKEN_CACHE_TTL = 5  # seconds
+# Error message fragments that mean the token itself was rejected
+_REJECTION_RE = re.compile("invalid|expired|audience", re.IGNORECASE)
+
+_TokenCacheKey = Tuple[bytes, Optional[str]]
+
+_token_caches: "weakref.WeakKeyDictionary[Any, ExpiringCache[TokenValidationResult]]" = weakref.WeakKeyDictionary()
+_rejected_token_caches: "weakref.WeakKeyDictionary[Any, ExpiringCache[str]]" = (
+    weakref.WeakKeyDictionary()
+)
+_token_caches_lock = threading.Lock()
+
+# Concurrent cache misses for the same token share one validate_session call
+_inflight_validations: Dict[
+    Tuple[Any, bytes, Optional[str]], "Future[TokenValidationResult]"
+] = {}
+_inflight_validations_lock = threading.Lock()
+
+
+def _token_cache_key(access_token: str, audience: Optional[str]) -> _TokenCacheKey:
+    """Build a cache key without keeping the raw token in memory."""
+    digest = hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+    return digest, audience
+
+
+def _get_token_cache(
+    descope_client: DescopeClient,
+) -> "ExpiringCache[TokenValidationResult]":
+    """Get the validation cache for a client, creating it on first use."""
+    with _token_caches_lock:
+        cache = _token_caches.get(descope_client)
+        if cache is None:
+            cache = _token_caches[descope_client] = ExpiringCache(
+                maxsize=_TOKEN_CACHE_MAX_SIZE
+            )
+        return cache
+
+
+def _get_rejected_token_cache(descope_client: DescopeClient) -> "ExpiringCache[str]":
+    """Get the rejected-token cache for a client, creating it on first use."""
+    with _token_caches_lock:
+        cache = _rejected_token_caches.get(descope_client)
+        if cache is None:
+            cache = _rejected_token_caches[descope_client] = ExpiringCache(
+                maxsize=_REJECTED_TOKEN_CACHE_MAX_SIZE
+            )
+        return cache
+
+
+# Claims that may hold the user ID, in order of preference
+_USER_ID_KEYS = ("sub", "userId", "user_id")
+_NESTED_USER_ID_KEYS = ("userId", "id", "sub")
+
+
+def _extract_user_id(validation_result: TokenValidationResult) -> Optional[str]:
+    """Find the user ID in a validation result, or None if it has none."""
+    # Descope's validate_session returns user information
+    claims = cast(Dict[str, Any], validation_result)
+    for key in _USER_ID_KEYS:
+        user_id = claims.get(key)
+        if user_id:
+            return user_id
+
+    # If not in top-level, check nested user object
+    user_info = claims.get("user")
+    if user_info:
+        for key in _NESTED_USER_ID_KEYS:
+            user_id = user_info.get(key)
+            if user_id:
+                return user_id
+
+    return None
+
+
+class _CachedValidationResult(dict):
+    """Cached validation result carrying values derived from its claims.
+
+    ``require_scopes`` uses ``scope_set`` directly, so scope checks on a cached
+    result don't rebuild a set from the ``scopes`` claim on every call, and
+    ``validate_token_and_get_user_id`` reads ``resolved_user_id`` instead of
+    searching the claims again. Both are stored in slots rather than a
+    per-instance ``__dict__``.
+
+    Callers get copies from ``_copy_validation``, so changes they make to a
+    result, including its ``scopes`` list, don't leak into the cache.
+    """
+
+    __slots__ = ("scope_set", "resolved_user_id")
+
+    scope_set: FrozenSet[str]
+    resolved_user_id: Optional[str]
+
+    def copy(self) -> "_CachedValidationResult":
+        """Return a shallow copy that keeps the derived values."""
+        result = _CachedValidationResult(self)
+        result.scope_set = self.scope_set
+        result.resolved_user_id = self.resolved_user_id
+        return result
+
+
+def _copy_validation(result: TokenValidationResult) -> TokenValidationResult:
+    """Copy a validation result, with its own ``scopes`` list, for a caller."""
+    copied = cast(TokenValidationResult, result.copy())
+    scopes = copied.get("scopes")
+    if isinstance(scopes, list):
+        copied["scopes"] = list(scopes)
+    return copied
+
+
+def _cache_validation(
+    descope_client: DescopeClient,
+    key: _TokenCacheKey,
+    result: TokenValidationResult,
+) -> TokenValidationResult:
+    """Cache a validation result until shortly before the token's ``exp`` claim.
+
+    Entries are kept for at most ``_TOKEN_CACHE_MAX_TTL`` seconds.
+
+    Returns the result to hand back to the caller, which is a copy of the cached
+    entry when the result could be cached.
+    """
+    exp = result.get("exp")
+    if not isinstance(exp, (int, float)):
+        # Without an expiry we can't tell how long the result stays valid
+        return result
+    cached = _CachedValidationResult(result)
+    # Interned so lookups of interned required scopes can match by identity
+    cached.scope_set = frozenset(map(sys.intern, result.get("scopes") or ()))
+    cached.resolved_user_id = _extract_user_id(result)
+    cached_result = cast(TokenValidationResult, cached)
+    _get_token_cache(descope_client).set(
+        key,
+        cached_result,
+        expires_at=min(
+            exp - _TOKEN_CACHE_EXPIRY_SKEW, time.time() + _TOKEN_CACHE_MAX_TTL
+        ),
+    )
+    return _copy_validation(cached_result)
+
+
+def _clear_token_cache() -> None:
+    """Drop all cached token validation results."""
+    with _token_caches_lock:
+        _token_caches.clear()
+        _rejected_token_caches.clear()
+
+
+def _resolve_client_and_audience(
+    descope_client: Optional[DescopeClient], audience: Optional[str]
+) -> Tuple[DescopeClient, Optional[str]]:
+    """Fill in the client and audience from the global context when not given."""
+    context = _get_context()
+
+    # Use provided client or global context
+    if descope_client is None:
+        descope_client = context.get_client()
+        if descope_client is None:
+            raise ValueError(
+                "No Descope client available. "
+                "Either call DescopeMCP() first or pass descope_client parameter."
+            )
+
+    # Use provided audience or get from global context. If still not available,
+    # skip audience validation (do not validate the JWT 'aud' claim).
+    if audience is None:
+        audience = context.get_mcp_server_url()
+
+    return descope_client, audience
+
+
+def _get_cached_validation(
+    descope_client: DescopeClient, cache_key: _TokenCacheKey
+) -> Optional[TokenValidationResult]:
+    """Return a cached validation result, raising again for a recently rejected token."""
+    cached_result = _get_token_cache(descope_client).get(cache_key)
+    if cached_result is not None:
+        return _copy_validation(cached_result)
+    rejection = _get_rejected_token_cache(descope_client).get(cache_key)
+    if rejection is not None:
+        raise ValueError(rejection)
+    return None
+
+
+def _require_user_id(validation_result: TokenValidationResult) -> str:
+    """Get the user ID from a validation result, raising ValueError if it has none."""
+    # Reuse the user ID found when the result was cached
+    user_id = getattr(validation_result, "resolved_user_id", None) or _extract_user_id(
+        validation_result
+    )
+
+    if not user_id:
+        raise ValueError("User ID not found in token validation result")
+
+    return user_id
+
 
 def validate_token(
     access_token: str,
@@ -155,6 +419,13 @@ def validate_token(
         Note: Not all fields may be present in every token. Use ``.get()`` with defaults
         when accessing fields.
 
+        Validation is offline: the signature is checked locally against the
+        project's JWKS, with no introspection call to Descope. Successful results
+        are cached until shortly before the token's ``exp`` claim, so repeated
+        calls with the same token skip signature verification. Concurrent calls
+        with the same uncached token share one verification. Rejected tokens
+        are remembered for a few seconds and fail again without re-validation.
+
     Raises:
         ValueError: If token is invalid or no client available
         Exception: If token validation fails
@@ -181,22 +452,45 @@ def validate_token(
             pass
         ```
     """
-    # Use provided client or global context
-    if descope_client is None:
-        context = _get_context()
-        descope_client = context.get_client()
-        if descope_client is None:
-            raise ValueError(
-                "No Descope client available. "
-                "Either call DescopeMCP() first or pass descope_client parameter."
-            )
+    descope_client, audience = _resolve_client_and_audience(descope_client, audience)
+    cache_key = _token_cache_key(access_token, audience)
+    cached_result = _get_cached_validation(descope_client, cache_key)
+    if cached_result is not None:
+        return cached_result
+
+    # Concurrent misses for the same token wait for the first caller's result
+    inflight_key = (descope_client, *cache_key)
+    with _inflight_validations_lock:
+        future = _inflight_validations.get(inflight_key)
+        is_leader = future is None
+        if future is None:
+            future = _inflight_validations[inflight_key] = Future()
+    if not is_leader:
+        # Each waiter gets its own copy of the shared result
+        return _copy_validation(future.result())
+
+    try:
+        validation_result = _verify_token(
+            access_token, descope_client, audience, cache_key
+        )
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(validation_result)
+        return validation_result
+    finally:
+        with _inflight_validations_lock:
+            _inflight_validations.pop(inflight_key, None)
 
-    # Use provided audience or get from global context. If still not available,
-    # skip audience validation (do not validate the JWT 'aud' claim).
-    if audience is None:
-        context = _get_context()
-        audience = context.get_mcp_server_url()
 
+def _verify_token(
+    access_token: str,
+    descope_client: DescopeClient,
+    audience: Optional[str],
+    cache_key: _TokenCacheKey,
+) -> TokenValidationResult:
+    """Run validate_session for a cache miss and cache the outcome."""
     try:
         # Use Descope SDK's validate_session method
         # This properly validates the token signature, expiration, and audience claim
@@ -213,16 +507,16 @@ def validate_token(
 
         # Return the full validation result
         # This includes user ID, tenant info, scopes, and all other token claims
-        return validation_result
+        return _cache_validation(descope_client, cache_key, validation_result)
     except Exception as e:
         # If validate_session fails, provide helpful error message
         error_msg = str(e)
-        if (
-            "invalid" in error_msg.lower()
-            or "expired" in error_msg.lower()
-            or "audience" in error_msg.lower()
-        ):
-            raise ValueError(f"Token validation failed: {error_msg}")
+        if _REJECTION_RE.search(error_msg):
+            rejection = f"Token validation failed: {error_msg}"
+            _get_rejected_token_cache(descope_client).set(
+                cache_key, rejection, expires_at=time.time() + _REJECTED_TOKEN_CACHE_TTL
+            )
+            raise ValueError(rejection)
         raise Exception(f"Token validation failed: {error_msg}")
 
 
@@ -262,31 +556,15 @@ def validate_token_and_get_user_id(
         user_id = validate_token_and_get_user_id(access_token)
         ```
     """
-    # Use the full validate_token function and extract user_id
-    validation_result = validate_token(access_token, descope_client, audience)
-
-    # Extract user ID from validation result
-    # Descope's validate_session returns user information
-    user_id = (
-        validation_result.get("sub")
-        or validation_result.get("userId")
-        or validation_result.get("user_id")
+    # Same path as the scoped variant; with no scopes it skips require_scopes
+    return validate_token_require_scopes_and_get_user_id(
+        access_token, (), descope_client, audience
     )
 
-    # If not in top-level, check nested user object
-    if not user_id and "user" in validation_result:
-        user_info = validation_result["user"]
-        user_id = user_info.get("userId") or user_info.get("id") or user_info.get("sub")
-
-    if not user_id:
-        raise ValueError("User ID not found in token validation result")
-
-    return user_id
-
 
 def require_scopes(
     token_result: TokenValidationResult,
-    required_scopes: List[str],
+    required_scopes: Collection[str],
     error_description: Optional[str] = None,
 ) -> None:
     """Validate that token has required scopes, raise InsufficientScopeError if not.
@@ -297,7 +575,8 @@ def require_scopes(
 
     Args:
         token_result: Token validation result from validate_token()
-        required_scopes: List of scopes required for the operation
+        required_scopes: Scopes required for the operation. A ``frozenset`` defined
+            once at module level avoids rebuilding the set on every call.
         error_description: Optional custom error description
 
     Raises:
@@ -348,16 +627,34 @@ def require_scopes(
 
     # Get scopes from token result
     token_scopes = token_result.get("scopes", [])
+    token_scope_set = getattr(token_result, "scope_set", None)
 
     # Check if all required scopes are present
-    required_set = set(required_scopes)
-    token_set = set(token_scopes)
-    missing_scopes = required_set - token_set
+    if len(required_scopes) == 1:
+        # A single scope (the common case) is a membership test, no set needed
+        (scope,) = required_scopes
+        has_scopes = scope in (
+            token_scope_set if token_scope_set is not None else token_scopes
+        )
+    else:
+        required_set = (
+            required_scopes
+            if isinstance(required_scopes, frozenset)
+            else frozenset(required_scopes)
+        )
+        if token_scope_set is not None:
+            has_scopes = required_set <= token_scope_set
+        else:
+            has_scopes = required_set.issubset(token_scopes)
 
-    if missing_scopes:
+    if not has_scopes:
         # Raise exception with MCP spec-compliant error information
         raise InsufficientScopeError(
-            required_scopes=required_scopes,
+            required_scopes=(
+                required_scopes
+                if isinstance(required_scopes, list)
+                else sorted(set(required_scopes))
+            ),
             token_scopes=token_scopes,
             error_description=error_description,
         )
@@ -365,7 +662,7 @@ def require_scopes(
 
 def validate_token_require_scopes_and_get_user_id(
     access_token: str,
-    required_scopes: List[str],
+    required_scopes: Collection[str],
     descope_client: Optional[DescopeClient] = None,
     audience: Optional[str] = None,
     error_description: Optional[str] = None,
@@ -378,7 +675,7 @@ def validate_token_require_scopes_and_get_user_id(
 
     Args:
         access_token: MCP server access token from the request
-        required_scopes: List of scopes required for the operation
+        required_scopes: Scopes required for the operation (list or set)
         descope_client: Optional Descope client instance (uses global context if not provided)
         audience: Optional audience claim to validate (uses MCP server URL from context if not provided)
         error_description: Optional custom error description for scope errors
@@ -413,22 +710,65 @@ def validate_token_require_scopes_and_get_user_id(
     # Validate token
     token_result = validate_token(access_token, descope_client, audience)
 
-    # Require scopes (raises InsufficientScopeError if missing)
-    require_scopes(token_result, required_scopes, error_description)
+    # Require scopes (raises InsufficientScopeError if missing); auth-only
+    # callers pass no scopes, so skip the call entirely for them
+    if required_scopes:
+        require_scopes(token_result, required_scopes, error_description)
+
+    return _require_user_id(token_result)
+
+
+async def validate_token_async(
+    access_token: str,
+    descope_client: Optional[DescopeClient] = None,
+    audience: Optional[str] = None,
+) -> TokenValidationResult:
+    """Validate MCP server access token without blocking the event loop.
+
+    Async variant of validate_token() with the same arguments and caching. Cached
+    results are returned directly; on a cache miss, signature verification (and
+    any JWKS fetch) runs in a worker thread.
+
+    Example:
+        ```python
+        from descope_mcp import validate_token_async
 
-    # Extract user ID
-    user_id = (
-        token_result.get("sub")
-        or token_result.get("userId")
-        or token_result.get("user_id")
+        @mcp.tool()
+        async def my_tool(mcp_access_token: str) -> str:
+            result = await validate_token_async(mcp_access_token)
+        ```
+    """
+    descope_client, audience = _resolve_client_and_audience(descope_client, audience)
+    cached_result = _get_cached_validation(
+        descope_client, _token_cache_key(access_token, audience)
+    )
+    if cached_result is not None:
+        return cached_result
+    return await asyncio.to_thread(
+        validate_token, access_token, descope_client, audience
     )
 
-    # If not in top-level, check nested user object
-    if not user_id and "user" in token_result:
-        user_info = token_result["user"]
-        user_id = user_info.get("userId") or user_info.get("id") or user_info.get("sub")
 
-    if not user_id:
-        raise ValueError("User ID not found in token validation result")
+async def validate_token_and_get_user_id_async(
+    access_token: str,
+    descope_client: Optional[DescopeClient] = None,
+    audience: Optional[str] = None,
+) -> str:
+    """Async variant of validate_token_and_get_user_id()."""
+    return await validate_token_require_scopes_and_get_user_id_async(
+        access_token, (), descope_client, audience
+    )
 
-    return user_id
+
+async def validate_token_require_scopes_and_get_user_id_async(
+    access_token: str,
+    required_scopes: Collection[str],
+    descope_client: Optional[DescopeClient] = None,
+    audience: Optional[str] = None,
+    error_description: Optional[str] = None,
+) -> str:
+    """Async variant of validate_token_require_scopes_and_get_user_id()."""
+    token_result = await validate_token_async(access_token, descope_client, audience)
+    if required_scopes:
+        require_scopes(token_result, required_scopes, error_description)
+    return _require_user_id(token_result)
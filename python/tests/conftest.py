@@ -18,6 +18,21 @@ def setup_test_env(monkeypatch):
     monkeypatch.setenv("DESCOPE_PROJECT_ID", "test-project-id")
 
 
+@pytest.fixture(autouse=True)
+def clear_sdk_caches():
+    """Keep cached tokens from leaking between tests."""
+    from descope_mcp.connections import _connection_token_cache, _descope_clients
+    from descope_mcp.session import _clear_token_cache
+
+    _clear_token_cache()
+    _connection_token_cache.clear()
+    _descope_clients.clear()
+    yield
+    _clear_token_cache()
+    _connection_token_cache.clear()
+    _descope_clients.clear()
+
+
 @pytest.fixture
 def mock_descope_client():
     """Create a mock DescopeClient for testing."""
@@ -0,0 +1,134 @@
+"""Tests for DescopeMCPClient session pooling and sharing (no server process)."""
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from descope_mcp.client import DescopeMCPClient, _shared_clients, create_client
+
+
+class TestDescopeMCPClient:
+    """Test client connection lifecycle with stubbed server sessions."""
+
+    @pytest.fixture
+    def sessions(self):
+        """Stub _open_session, recording which task opens and closes each session."""
+        events = []
+
+        @contextlib.asynccontextmanager
+        async def transport(index):
+            events.append(("open", index, asyncio.current_task()))
+            try:
+                yield
+            finally:
+                events.append(("close", index, asyncio.current_task()))
+
+        async def open_session(exit_stack, server):
+            index = sum(1 for event in events if event[0] == "open")
+            await exit_stack.enter_async_context(transport(index))
+            # Yield so concurrent connect() calls can interleave
+            await asyncio.sleep(0.01)
+            session = MagicMock()
+            text = MagicMock(type="text", text="{}")
+            session.call_tool = AsyncMock(return_value=MagicMock(content=[text]))
+            return session
+
+        with patch.object(DescopeMCPClient, "_open_session", side_effect=open_session):
+            yield events
+
+        _shared_clients.clear()
+
+    @pytest.mark.asyncio
+    async def test_pool_spreads_tool_calls_round_robin(self, sessions):
+        """pool_size sessions are opened once and tool calls rotate across them."""
+        async with DescopeMCPClient(["srv"], pool_size=3) as client:
+            for _ in range(6):
+                await client._call_tool("tool", {})
+            used = [session.call_tool.await_count for session in client._sessions]
+
+        assert used == [2, 2, 2]
+        assert [event[0] for event in sessions] == ["open"] * 3 + ["close"] * 3
+
+    @pytest.mark.asyncio
+    async def test_nested_blocks_share_one_connection(self, sessions):
+        """The client stays connected until the last async with block exits."""
+        client = DescopeMCPClient(["srv"])
+        async with client:
+            async with client:
+                pass
+            assert client.session is not None
+        assert client.session is None
+        assert [event[0] for event in sessions] == ["open", "close"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_entry_opens_sessions_once(self, sessions):
+        """Concurrent blocks on a shared client open and close the sessions once."""
+
+        async def use_client():
+            async with create_client(["srv"]) as client:
+                await asyncio.sleep(0.01)
+                return client
+
+        clients = await asyncio.gather(*(use_client() for _ in range(3)))
+
+        assert clients[0] is clients[1] is clients[2]
+        assert [event[0] for event in sessions] == ["open", "close"]
+        # Transports are entered and exited by the same task
+        assert sessions[0][2] is sessions[1][2]
+        assert clients[0].session is None
+
+    @pytest.mark.asyncio
+    async def test_failed_connect_can_be_retried(self, sessions):
+        """A connection error propagates and leaves the client disconnected."""
+        client = DescopeMCPClient(["srv"])
+        with patch.object(
+            DescopeMCPClient, "_open_session", side_effect=OSError("spawn failed")
+        ):
+            with pytest.raises(OSError, match="spawn failed"):
+                async with client:
+                    pass
+        assert client.session is None
+        assert client._context_users == 0
+
+        async with client:
+            assert client.session is not None
+
+    def test_shared_client_works_across_event_loops(self, sessions):
+        """create_client's shared client reconnects on a later asyncio.run()."""
+
+        async def call_tool():
+            async with create_client(["srv"]) as client:
+                await client._call_tool("tool", {})
+                return client, client.session
+
+        async def call_tools():
+            # Concurrent entry contends for the lock, binding it to the loop
+            first, _ = await asyncio.gather(call_tool(), call_tool())
+            return first
+
+        first_client, first_session = asyncio.run(call_tools())
+        second_client, second_session = asyncio.run(call_tools())
+
+        assert first_client is second_client
+        assert first_session is not second_session
+        assert [event[0] for event in sessions] == ["open", "close"] * 2
+
+    def test_client_left_connected_is_reset_on_new_loop(self, sessions):
+        """Sessions from a closed loop aren't reused by a later one."""
+        client = create_client(["srv"])
+        asyncio.run(client.connect())
+
+        async def call_tool():
+            await client._call_tool("tool", {})
+
+        with pytest.raises(RuntimeError, match="not connected"):
+            asyncio.run(call_tool())
+
+        async def reconnect():
+            async with client:
+                await client._call_tool("tool", {})
+
+        asyncio.run(reconnect())
+        assert client.session is None
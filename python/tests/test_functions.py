@@ -1,20 +1,43 @@
 """End-to-end tests for SDK functions directly (no MCP server)."""
 
+import asyncio
+import base64
+import json
 import os
-from unittest.mock import MagicMock, Mock, patch
+import pickle
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
 from descope_mcp import (
     DescopeConfig,
     DescopeMCP,
+    InsufficientScopeError,
+    UserTokenRequest,
     fetch_tenant_token,
     fetch_tenant_token_by_scopes,
     get_connection_token,
+    get_connection_token_async,
+    get_connection_tokens_bulk,
+    require_scopes,
+    validate_token,
     validate_token_and_get_user_id,
+    validate_token_and_get_user_id_async,
+    validate_token_require_scopes_and_get_user_id,
+    validate_token_require_scopes_and_get_user_id_async,
 )
 
 
+def _mock_json_response(data):
+    """Build a mocked httpx response whose body is ``data`` encoded as JSON."""
+    response = MagicMock()
+    response.json.return_value = data
+    response.content = json.dumps(data).encode()
+    return response
+
+
 class TestDirectFunctions:
     """Test SDK functions directly without MCP server."""
 
@@ -53,6 +76,211 @@ class TestDirectFunctions:
             assert user_id == "user-123"
             mock_descope_client.validate_session.assert_called_once()
 
+    def test_validate_token_caches_result_until_expiry(self, mock_descope_client):
+        """Repeated validation of the same token should skip validate_session."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "exp": time.time() + 3600,
+        }
+
+        first = validate_token("test-token", mock_descope_client, audience="aud")
+        second = validate_token("test-token", mock_descope_client, audience="aud")
+
+        assert first == second
+        mock_descope_client.validate_session.assert_called_once()
+
+        # The same token presented for another audience is validated on its own
+        validate_token("test-token", mock_descope_client, audience="other-aud")
+        assert mock_descope_client.validate_session.call_count == 2
+
+    def test_validate_token_cached_result_is_not_shared(self, mock_descope_client):
+        """Changes a caller makes to a result don't affect later cache hits."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "scopes": ["read"],
+            "exp": time.time() + 3600,
+        }
+
+        first = validate_token("test-token", mock_descope_client, audience="aud")
+        first["sub"] = "attacker"
+        first["scopes"].remove("read")
+
+        second = validate_token("test-token", mock_descope_client, audience="aud")
+        assert second is not first
+        assert second["sub"] == "user-123"
+        assert second["scopes"] == ["read"]
+        require_scopes(second, ["read"])
+        mock_descope_client.validate_session.assert_called_once()
+
+    def test_validate_token_coalesces_concurrent_misses(self, mock_descope_client):
+        """Concurrent validations of one uncached token verify it only once."""
+
+        def slow_validate_session(**kwargs):
+            time.sleep(0.05)
+            return {"sub": "user-123", "exp": time.time() + 3600}
+
+        mock_descope_client.validate_session.side_effect = slow_validate_session
+
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            user_ids = list(
+                pool.map(
+                    lambda _: validate_token_and_get_user_id(
+                        "test-token", mock_descope_client, audience="aud"
+                    ),
+                    range(5),
+                )
+            )
+
+        assert user_ids == ["user-123"] * 5
+        mock_descope_client.validate_session.assert_called_once()
+
+    def test_validate_token_cache_ttl_is_capped(self, mock_descope_client):
+        """Long-lived tokens are re-validated once the maximum cache TTL passes."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "exp": time.time() + 3600,
+        }
+
+        validate_token("test-token", mock_descope_client, audience="aud")
+        with patch("descope_mcp.cache.time.time", return_value=time.time() + 600):
+            validate_token("test-token", mock_descope_client, audience="aud")
+
+        assert mock_descope_client.validate_session.call_count == 2
+
+    def test_validate_token_skips_cache_near_expiry(self, mock_descope_client):
+        """Tokens about to expire should always be re-validated."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "exp": time.time() + 5,
+        }
+
+        validate_token("test-token", mock_descope_client, audience="aud")
+        validate_token("test-token", mock_descope_client, audience="aud")
+
+        assert mock_descope_client.validate_session.call_count == 2
+
+    def test_validate_token_does_not_cache_failures(self, mock_descope_client):
+        """A transient failure should be retried rather than served from cache."""
+        mock_descope_client.validate_session.side_effect = [
+            Exception("Connection reset"),
+            {"sub": "user-123", "scopes": ["read"], "exp": time.time() + 3600},
+        ]
+
+        with pytest.raises(Exception, match="Connection reset"):
+            validate_token("test-token", mock_descope_client, audience="aud")
+
+        # Scope-checking entry points share the same validation cache
+        for _ in range(3):
+            user_id = validate_token_require_scopes_and_get_user_id(
+                "test-token",
+                ["read"],
+                descope_client=mock_descope_client,
+                audience="aud",
+            )
+            assert user_id == "user-123"
+
+        assert mock_descope_client.validate_session.call_count == 2
+
+    def test_validate_token_briefly_caches_rejections(self, mock_descope_client):
+        """Replaying a rejected token fails again without re-validating it."""
+        mock_descope_client.validate_session.side_effect = Exception("Token expired")
+
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Token expired"):
+                validate_token("test-token", mock_descope_client, audience="aud")
+        mock_descope_client.validate_session.assert_called_once()
+
+        # The rejection is only remembered for a few seconds
+        with patch("descope_mcp.cache.time.time", return_value=time.time() + 10):
+            with pytest.raises(ValueError):
+                validate_token("test-token", mock_descope_client, audience="aud")
+        assert mock_descope_client.validate_session.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_validate_token_async_variants(self, mock_descope_client):
+        """Async validation shares the sync cache and user ID/scope handling."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "scopes": ["read"],
+            "exp": time.time() + 3600,
+        }
+
+        user_id = await validate_token_and_get_user_id_async(
+            "test-token", mock_descope_client, audience="aud"
+        )
+        assert user_id == "user-123"
+
+        # Served from the cache filled by the first call
+        assert user_id == validate_token_and_get_user_id(
+            "test-token", mock_descope_client, audience="aud"
+        )
+        with pytest.raises(InsufficientScopeError):
+            await validate_token_require_scopes_and_get_user_id_async(
+                "test-token", ["write"], mock_descope_client, audience="aud"
+            )
+        mock_descope_client.validate_session.assert_called_once()
+
+    def test_extract_project_id_ignores_query_and_fragment(self):
+        """Query strings and fragments are not part of the extracted project ID."""
+        from descope_mcp.descope_mcp import _extract_project_id_from_url
+
+        for url in (
+            "https://api.descope.com/P123/.well-known/openid-configuration",
+            "https://api.descope.com/P123?x=/y",
+            "https://api.descope.com/P123#frag/z",
+        ):
+            assert _extract_project_id_from_url(url) == "P123"
+
+    def test_insufficient_scope_error_keeps_args(self):
+        """The error carries its constructor arguments and survives pickling."""
+        error = InsufficientScopeError(["write"], ["read"])
+
+        assert error.args == (["write"], ["read"], None)
+        assert str(error) == "Token missing required scopes: write"
+
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.to_dict() == error.to_dict()
+
+    def test_require_scopes_accepts_frozenset(self):
+        """Scope sets built once at module level can be passed directly."""
+        token_result = {"sub": "user-123", "scopes": ["read"]}
+
+        require_scopes(token_result, frozenset({"read"}))
+
+        with pytest.raises(InsufficientScopeError) as exc_info:
+            require_scopes(token_result, frozenset({"read", "write"}))
+
+        assert exc_info.value.required_scopes == ["read", "write"]
+        assert exc_info.value.missing_scopes == ["write"]
+        assert json.loads(exc_info.value.to_json())["scope"] == "read write"
+
+        # Single scopes take a membership fast path with the same error
+        require_scopes(token_result, ["read"])
+        with pytest.raises(InsufficientScopeError) as exc_info:
+            require_scopes(token_result, ("write",))
+        assert exc_info.value.required_scopes == ["write"]
+
+    def test_require_scopes_uses_cached_scope_set(self, mock_descope_client):
+        """Cached validation results should carry their scopes as a frozenset."""
+        mock_descope_client.validate_session.return_value = {
+            "sub": "user-123",
+            "scopes": ["read", "calendar.read"],
+            "exp": time.time() + 3600,
+        }
+
+        token_result = validate_token("test-token", mock_descope_client, audience="aud")
+
+        assert token_result.scope_set == frozenset({"read", "calendar.read"})
+        assert token_result.resolved_user_id == "user-123"
+        assert token_result["scopes"] == ["read", "calendar.read"]
+        require_scopes(token_result, frozenset({"calendar.read"}))
+
+        with pytest.raises(InsufficientScopeError) as exc_info:
+            require_scopes(token_result, ["calendar.write"])
+
+        assert exc_info.value.missing_scopes == ["calendar.write"]
+        assert exc_info.value.token_scopes == ["read", "calendar.read"]
+
     def test_get_connection_token(self, mock_descope_client):
         """Test connection token retrieval."""
         DescopeMCP(
@@ -72,6 +300,446 @@ class TestDirectFunctions:
             assert token == "connection-token-123"
             mock_descope_client.mgmt.outbound_application.fetch_token_by_scopes.assert_called_once()
 
+    def test_get_connection_token_reuses_management_key_client(
+        self, mock_descope_client
+    ):
+        """The DescopeClient built from project_id/management_key is created once."""
+        with patch(
+            "descope.DescopeClient", return_value=mock_descope_client
+        ) as client_cls:
+            for _ in range(2):
+                token = get_connection_token(
+                    user_id="user-123",
+                    app_id="google-calendar",
+                    project_id="P123",
+                    management_key="mgmt-key",
+                )
+                assert token == "connection-token-123"
+
+        client_cls.assert_called_once_with(project_id="P123", management_key="mgmt-key")
+
+    @pytest.mark.asyncio
+    async def test_fetch_tenant_token_reuses_descope_client(self, mock_descope_client):
+        """Standalone fetch functions share one DescopeClient per config."""
+        mock_descope_client.mgmt.outbound_application.fetch_tenant_token.return_value = {
+            "token": "tenant-token"
+        }
+        config = DescopeConfig(
+            well_known_url="https://api.descope.com/P123/.well-known/openid-configuration",
+            management_key="mgmt-key",
+        )
+
+        with patch(
+            "descope.DescopeClient", return_value=mock_descope_client
+        ) as client_cls:
+            for _ in range(2):
+                await fetch_tenant_token(config, "slack", "tenant-1")
+
+        client_cls.assert_called_once_with(project_id="P123", management_key="mgmt-key")
+
+    def test_get_connection_token_caches_access_token_fetches(self):
+        """Connection tokens fetched with an access token are reused until expiry."""
+        mock_http_client = MagicMock()
+        mock_resp = _mock_json_response(
+            {
+                "token": {
+                    "accessToken": "google-token-xyz",
+                    "accessTokenExpiry": time.time() + 3600,
+                }
+            }
+        )
+        mock_http_client.post.return_value = mock_resp
+
+        with patch(
+            "descope_mcp.connections._get_http_client", return_value=mock_http_client
+        ):
+            tokens = [
+                get_connection_token(
+                    user_id="user-123",
+                    app_id="google-calendar",
+                    scopes=["calendar.readonly"],
+                    access_token="access-token-abc",
+                    project_id="P123",
+                )
+                for _ in range(2)
+            ]
+
+            assert tokens == ["google-token-xyz", "google-token-xyz"]
+            mock_http_client.post.assert_called_once()
+
+            # Explicit options (e.g. refresh) always go to Descope
+            get_connection_token(
+                user_id="user-123",
+                app_id="google-calendar",
+                scopes=["calendar.readonly"],
+                options={"refreshToken": True},
+                access_token="access-token-abc",
+                project_id="P123",
+            )
+            assert mock_http_client.post.call_count == 2
+
+    def test_get_connection_token_uses_jwt_exp_without_expiry(self):
+        """Without accessTokenExpiry, a JWT token's own exp claim bounds the cache."""
+        claims = base64.urlsafe_b64encode(
+            json.dumps({"exp": int(time.time()) + 60}).encode()
+        ).rstrip(b"=")
+        jwt_token = f"header.{claims.decode()}.signature"
+        mock_http_client = MagicMock()
+        mock_http_client.post.return_value = _mock_json_response(
+            {"token": {"accessToken": jwt_token}}
+        )
+
+        with patch(
+            "descope_mcp.connections._get_http_client", return_value=mock_http_client
+        ):
+            for _ in range(2):
+                token = get_connection_token(
+                    user_id="user-123",
+                    app_id="google-calendar",
+                    access_token="access-token-abc",
+                    project_id="P123",
+                )
+                assert token == jwt_token
+
+        # The token expires within the refresh window, so it is never cached
+        assert mock_http_client.post.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_connection_token_async(self, mock_descope_client):
+        """The async variant shares the cache and offloads SDK calls to a thread."""
+        mock_http_client = MagicMock()
+        mock_http_client.post = AsyncMock(return_value=MagicMock())
+        mock_http_client.post.return_value = _mock_json_response(
+            {
+                "token": {
+                    "accessToken": "google-token-xyz",
+                    "accessTokenExpiry": time.time() + 3600,
+                }
+            }
+        )
+
+        with patch(
+            "descope_mcp.connections._get_async_http_client",
+            return_value=mock_http_client,
+        ):
+            for _ in range(2):
+                token = await get_connection_token_async(
+                    user_id="user-123",
+                    app_id="google-calendar",
+                    access_token="access-token-abc",
+                    project_id="P123",
+                )
+                assert token == "google-token-xyz"
+
+        mock_http_client.post.assert_awaited_once()
+        args, kwargs = mock_http_client.post.call_args
+        assert args[0].endswith("/v1/mgmt/outbound/app/user/token/latest")
+        assert kwargs["headers"]["Authorization"] == "Bearer P123:access-token-abc"
+
+        # Without an access token, the management key path goes through the SDK
+        token = await get_connection_token_async(
+            user_id="user-123",
+            app_id="google-calendar",
+            scopes=["calendar.readonly"],
+            descope_client=mock_descope_client,
+        )
+        assert token == "connection-token-123"
+        mock_descope_client.mgmt.outbound_application.fetch_token_by_scopes.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_connection_token_requests_are_coalesced(self):
+        """Concurrent cache misses for the same token share one Descope request."""
+        response = _mock_json_response(
+            {
+                "token": {
+                    "accessToken": "google-token-xyz",
+                    "accessTokenExpiry": time.time() + 3600,
+                }
+            }
+        )
+
+        async def slow_post(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return response
+
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(side_effect=slow_post)
+        with patch(
+            "descope_mcp.connections._get_async_http_client",
+            return_value=mock_async_client,
+        ):
+            tokens = await asyncio.gather(
+                *(
+                    get_connection_token_async(
+                        user_id="user-123",
+                        app_id="google-calendar",
+                        access_token="access-token-abc",
+                        project_id="P123",
+                    )
+                    for _ in range(5)
+                )
+            )
+        assert tokens == ["google-token-xyz"] * 5
+        assert mock_async_client.post.await_count == 1
+
+        # The sync variant coalesces concurrent threads the same way
+        def slow_sync_post(*args, **kwargs):
+            time.sleep(0.05)
+            return response
+
+        mock_client = MagicMock()
+        mock_client.post.side_effect = slow_sync_post
+        with (
+            patch("descope_mcp.connections._get_http_client", return_value=mock_client),
+            ThreadPoolExecutor(max_workers=5) as pool,
+        ):
+            tokens = list(
+                pool.map(
+                    lambda _: get_connection_token(
+                        user_id="user-123",
+                        app_id="google-calendar",
+                        access_token="other-access-token",
+                        project_id="P123",
+                    ),
+                    range(5),
+                )
+            )
+        assert tokens == ["google-token-xyz"] * 5
+        assert mock_client.post.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_get_connection_tokens_bulk(self):
+        """Bulk fetches run concurrently and return tokens in request order."""
+
+        async def post(url, headers, json):
+            await asyncio.sleep(0.01 if json["appId"] == "google-calendar" else 0)
+            response = _mock_json_response(
+                {
+                    "token": {
+                        "accessToken": f"{json['appId']}-token",
+                        "accessTokenExpiry": time.time() + 3600,
+                    }
+                }
+            )
+            return response
+
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(side_effect=post)
+        with patch(
+            "descope_mcp.connections._get_async_http_client",
+            return_value=mock_async_client,
+        ):
+            tokens = await get_connection_tokens_bulk(
+                [
+                    UserTokenRequest(user_id="user-123", app_id="google-calendar"),
+                    UserTokenRequest(
+                        user_id="user-123", app_id="slack", scopes=["chat:write"]
+                    ),
+                ],
+                access_token="access-token-abc",
+                project_id="P123",
+                max_concurrency=2,
+            )
+
+        assert tokens == ["google-calendar-token", "slack-token"]
+        assert mock_async_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_connection_token_near_expiry_is_refreshed_in_background(self):
+        """A token inside the refresh window is served while a new one is fetched."""
+        responses = []
+        for token, lifetime in (("old-token", 200), ("new-token", 3600)):
+            response = _mock_json_response(
+                {
+                    "token": {
+                        "accessToken": token,
+                        "accessTokenExpiry": time.time() + lifetime,
+                    }
+                }
+            )
+            responses.append(response)
+
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(side_effect=responses)
+        kwargs = dict(
+            user_id="user-123",
+            app_id="google-calendar",
+            access_token="access-token-abc",
+            project_id="P123",
+        )
+        with patch(
+            "descope_mcp.connections._get_async_http_client",
+            return_value=mock_async_client,
+        ):
+            assert await get_connection_token_async(**kwargs) == "old-token"
+            # Served from cache immediately, with a refresh started alongside
+            assert await get_connection_token_async(**kwargs) == "old-token"
+            for _ in range(3):
+                await asyncio.sleep(0)
+            assert await get_connection_token_async(**kwargs) == "new-token"
+
+        assert mock_async_client.post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_background_refresh_is_not_retried_on_every_call(self):
+        """After a refresh fails, the cached token is served without new requests."""
+        mock_async_client = MagicMock()
+        mock_async_client.post = AsyncMock(
+            side_effect=[
+                _mock_json_response(
+                    {
+                        "token": {
+                            "accessToken": "old-token",
+                            "accessTokenExpiry": time.time() + 200,
+                        }
+                    }
+                ),
+                Exception("Descope unavailable"),
+            ]
+        )
+        kwargs = dict(
+            user_id="user-123",
+            app_id="google-calendar",
+            access_token="access-token-abc",
+            project_id="P123",
+        )
+        with (
+            patch(
+                "descope_mcp.connections._get_async_http_client",
+                return_value=mock_async_client,
+            ),
+            patch("descope_mcp.connections.logger") as mock_logger,
+        ):
+            assert await get_connection_token_async(**kwargs) == "old-token"
+            for _ in range(5):
+                assert await get_connection_token_async(**kwargs) == "old-token"
+                await asyncio.sleep(0)
+
+        assert mock_async_client.post.await_count == 2
+        mock_logger.warning.assert_called_once()
+
+    def test_connection_token_expiry_formats_and_upper_bound(self):
+        """Expiries are parsed from several formats and capped at the max TTL."""
+        from descope_mcp.connections import (
+            _CONNECTION_TOKEN_MAX_TTL,
+            _connection_token_expiry,
+        )
+
+        now = time.time()
+        assert _connection_token_expiry(
+            {"accessTokenExpiry": "2000-01-01T00:00:00Z"}
+        ) == pytest.approx(946684800)
+        assert _connection_token_expiry({"expiresIn": 600}) == pytest.approx(
+            now + 600, abs=5
+        )
+        assert _connection_token_expiry(
+            {"accessTokenExpiry": now + 86400}
+        ) == pytest.approx(now + _CONNECTION_TOKEN_MAX_TTL, abs=5)
+        # An opaque token without an expiry field has no known lifetime
+        assert _connection_token_expiry({"accessToken": "opaque-token"}) is None
+
+    def test_connection_token_without_expiry_is_not_cached(self):
+        """Tokens with an unknown expiry are fetched again on every call."""
+        mock_http_client = MagicMock()
+        mock_http_client.post.return_value = _mock_json_response(
+            {"token": {"accessToken": "opaque-token"}}
+        )
+
+        with patch(
+            "descope_mcp.connections._get_http_client", return_value=mock_http_client
+        ):
+            for _ in range(2):
+                token = get_connection_token(
+                    user_id="user-123",
+                    app_id="google-calendar",
+                    access_token="access-token-abc",
+                    project_id="P123",
+                )
+                assert token == "opaque-token"
+
+        assert mock_http_client.post.call_count == 2
+
+    def test_async_http_client_is_per_loop_and_closed_at_shutdown(self):
+        """Each event loop gets its own client, closed when asyncio.run() finishes."""
+        from descope_mcp.connections import _get_async_http_client
+
+        async def get_clients():
+            return _get_async_http_client(), _get_async_http_client()
+
+        first, same = asyncio.run(get_clients())
+        second, _ = asyncio.run(get_clients())
+
+        assert first is same
+        assert first is not second
+        assert first.is_closed and second.is_closed
+
+    def test_aclose_http_clients_closes_client_outside_asyncio_run(self):
+        """The explicit hook closes the client on loops asyncio.run() doesn't manage."""
+        from descope_mcp import aclose_http_clients
+        from descope_mcp.connections import _async_http_clients, _get_async_http_client
+
+        async def get_client():
+            return _get_async_http_client()
+
+        loop = asyncio.new_event_loop()
+        try:
+            client = loop.run_until_complete(get_client())
+            loop.run_until_complete(aclose_http_clients())
+            assert client.is_closed
+            assert loop not in _async_http_clients
+            # The next call on the loop opens a fresh client
+            assert loop.run_until_complete(get_client()) is not client
+            loop.run_until_complete(aclose_http_clients())
+        finally:
+            loop.close()
+
+    def test_async_http_clients_of_closed_loops_are_dropped(self):
+        """Entries for loops closed without the hook don't keep the loop alive."""
+        from descope_mcp.connections import _async_http_clients, _get_async_http_client
+
+        async def get_client():
+            return _get_async_http_client()
+
+        loop = asyncio.new_event_loop()
+        loop.run_until_complete(get_client())
+        loop.close()
+        assert loop in _async_http_clients
+
+        asyncio.run(get_client())
+        assert loop not in _async_http_clients
+
+    def test_fastmcp_server_lifespan_closes_client_after_last_session(self):
+        """create_descope_fastmcp_server closes the shared client on shutdown."""
+        from contextlib import asynccontextmanager
+
+        from descope_mcp import create_descope_fastmcp_server
+        from descope_mcp.connections import _get_async_http_client
+
+        @asynccontextmanager
+        async def user_lifespan(server):
+            yield {"db": "conn"}
+
+        mcp = create_descope_fastmcp_server(
+            config=DescopeConfig(
+                well_known_url="https://api.descope.com/P123/.well-known/openid-configuration"
+            ),
+            lifespan=user_lifespan,
+        )
+        lifespan = mcp.settings.lifespan
+
+        async def run_sessions():
+            async with lifespan(mcp) as context:
+                client = _get_async_http_client()
+                async with lifespan(mcp):
+                    pass
+                # Another session is still open, so the client stays usable
+                assert not client.is_closed
+            return context, client
+
+        context, client = asyncio.run(run_sessions())
+        assert context == {"db": "conn"}
+        assert client.is_closed
+
     def test_fetch_tenant_token(self, mock_descope_client):
         """Test tenant token fetching."""
         config = DescopeConfig(
@@ -131,15 +799,17 @@ class TestDirectFunctions:
             management_key=None,
         )
 
-        mock_httpx = MagicMock()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "token": {"accessToken": "tenant-access-token-xyz"}
-        }
+        mock_async_client = MagicMock()
+        mock_resp = _mock_json_response(
+            {"token": {"accessToken": "tenant-access-token-xyz"}}
+        )
         mock_resp.raise_for_status.return_value = None
-        mock_httpx.post.return_value = mock_resp
+        mock_async_client.post = AsyncMock(return_value=mock_resp)
 
-        with patch("descope_mcp.descope_mcp.httpx", mock_httpx):
+        with patch(
+            "descope_mcp.descope_mcp._get_async_http_client",
+            return_value=mock_async_client,
+        ):
             import asyncio
 
             result = asyncio.run(
@@ -153,7 +823,7 @@ class TestDirectFunctions:
             )
 
         # Verify correct endpoint and auth header format
-        args, kwargs = mock_httpx.post.call_args
+        args, kwargs = mock_async_client.post.await_args
         assert args[0].endswith("/v1/mgmt/outbound/app/tenant/token/latest")
         assert kwargs["headers"]["Authorization"] == "Bearer test:access-token-abc"
 
@@ -169,15 +839,17 @@ class TestDirectFunctions:
             management_key=None,
         )
 
-        mock_httpx = MagicMock()
-        mock_resp = MagicMock()
-        mock_resp.json.return_value = {
-            "token": {"accessToken": "tenant-access-token-scoped"}
-        }
+        mock_async_client = MagicMock()
+        mock_resp = _mock_json_response(
+            {"token": {"accessToken": "tenant-access-token-scoped"}}
+        )
         mock_resp.raise_for_status.return_value = None
-        mock_httpx.post.return_value = mock_resp
+        mock_async_client.post = AsyncMock(return_value=mock_resp)
 
-        with patch("descope_mcp.descope_mcp.httpx", mock_httpx):
+        with patch(
+            "descope_mcp.descope_mcp._get_async_http_client",
+            return_value=mock_async_client,
+        ):
             import asyncio
 
             result = asyncio.run(
@@ -191,7 +863,7 @@ class TestDirectFunctions:
                 )
             )
 
-        args, kwargs = mock_httpx.post.call_args
+        args, kwargs = mock_async_client.post.await_args
         assert args[0].endswith("/v1/mgmt/outbound/app/tenant/token")
         assert kwargs["headers"]["Authorization"] == "Bearer test:access-token-abc"
         assert kwargs["json"]["scopes"] == ["contacts.readonly"]
@@ -223,3 +895,8 @@ class TestDirectFunctions:
                 user_id="user-123", app_id="google-calendar"
             )
             assert token == "connection-token-123"
+
+            # Auth checks are shared per scope set, regardless of order
+            read_write_check = client.create_auth_check(["read", "write"])
+            assert client.create_auth_check(("write", "read")) is read_write_check
+            assert client.create_auth_check(["read"]) is not read_write_check